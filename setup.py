@@ -4,13 +4,69 @@ from datetime import datetime
 
 start_time = datetime.now()
 
-from setuptools import setup, find_packages
+import os
+import warnings
+
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+# 可选用Cython编译的热点模块（纯Python模式，源码保持不变）
+# 显式给出模块名：src/__init__.py 存在，交给cythonize推断会得到 src.config_manager.*
+# call_chain.py 不在此列：编译后的函数不产生Python栈帧，会打乱sys._getframe的层级
+CYTHON_MODULES = [
+    ('config_manager.config_node', 'src/config_manager/config_node.py'),
+]
+
+# 注解仅作文档用途，不让Cython据此做类型强制
+CYTHON_DIRECTIVES = {
+    'language_level': 3,
+    'annotation_typing': False,
+}
+
+
+class OptionalBuildExt(build_ext):
+    """编译失败时给出警告并回退到纯Python实现"""
+
+    def run(self):
+        try:
+            super().run()
+        except (CCompilerError, ExecError, PlatformError) as e:
+            warnings.warn(f"C扩展编译失败，使用纯Python实现: {e}")
+        return
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError, ValueError) as e:
+            warnings.warn(f"扩展 {ext.name} 编译失败，使用纯Python实现: {e}")
+        return
+
+
+def get_ext_modules():
+    """存在Cython时返回待编译的扩展模块，设置CONFIG_MANAGER_NO_CYTHON可强制关闭"""
+    if os.environ.get('CONFIG_MANAGER_NO_CYTHON'):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    extensions = [Extension(name, [source]) for name, source in CYTHON_MODULES]
+    try:
+        return cythonize(extensions, compiler_directives=CYTHON_DIRECTIVES, quiet=True)
+    except Exception as e:
+        # cythonize在构造setup()参数时执行，OptionalBuildExt捕获不到这里的错误
+        warnings.warn(f"Cython转换失败，使用纯Python实现: {e}")
+        return []
+
 
 setup(
     name='config_manager',
     version='1.0.0',
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
+    ext_modules=get_ext_modules(),
+    cmdclass={'build_ext': OptionalBuildExt},
     install_requires=[
         'ruamel.yaml',
     ],
@@ -5,7 +5,7 @@ from datetime import datetime
 start_time = datetime.now()
 
 # 修正导入路径 - 直接从当前包导入，而不是从 .core 子包
-from .config_manager import ConfigManager, get_config_manager, _clear_instances_for_testing
+from .config_manager import ConfigManager, get_config_manager, _clear_instances_for_testing, isolated_test_instances
 from .test_environment import TestEnvironmentManager
 from .config_node import ConfigNode
 from .serializable_config import SerializableConfigData, create_serializable_config
@@ -17,5 +17,6 @@ __all__ = [
     'get_config_manager',
     'create_serializable_config',
     '_clear_instances_for_testing',
+    'isolated_test_instances',
     'TestEnvironmentManager'
 ]
\ No newline at end of file
@@ -6,27 +6,101 @@ from typing import Union, Type
 start_time = datetime.now()
 
 import os
+import sys
+import logging
 import threading
 import uuid
 import tempfile
+import functools
+import contextlib
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+from pathlib import PurePath
 from typing import Any
 from .core.manager import ConfigManagerCore
 from .core.path_resolver import PathResolver
 from .core.cross_platform_paths import convert_to_multi_platform_config
 
+logger = logging.getLogger(__name__)
+
 # 全局调用链显示开关 - 手工修改这个值来控制调用链显示
 ENABLE_CALL_CHAIN_DISPLAY = False  # 默认关闭调用链显示
 
 
+@functools.lru_cache(maxsize=2048)
+def _derive_test_base_dir(test_config_path: str) -> str:
+    """由测试配置文件路径推导测试基础目录（去掉 /src/config/config.yaml）
+
+    路径只解析一次为PurePath，结果按参数缓存，相同路径重复调用只是一次字典查找。
+    """
+    parents = PurePath(test_config_path).parents
+    if len(parents) < 3:
+        return os.path.dirname(os.path.dirname(os.path.dirname(test_config_path)))
+    return str(parents[2])
+
+
+def _iter_caller_frames():
+    """从调用者开始逐层返回栈帧，不像inspect.stack()那样读取源码上下文"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+# 测试模式实例缓存：默认进程内共享；isolated_test_instances()中切换为当前上下文独有的字典
+_shared_test_instances = {}
+_test_instances_var: ContextVar[dict] = ContextVar('config_manager_test_instances')
+
+
+class _TestInstanceRegistry(MutableMapping):
+    """按上下文取用的测试模式实例缓存
+
+    未进入isolated_test_instances()的上下文（包括新建的线程）都使用进程共享的字典，
+    行为与普通字典相同；进入后只读写当前上下文自己的字典，并行运行的测试互不清理对方的实例。
+    """
+
+    @staticmethod
+    def _current() -> dict:
+        return _test_instances_var.get(_shared_test_instances)
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __setitem__(self, key, value):
+        self._current()[key] = value
+        return
+
+    def __delitem__(self, key):
+        del self._current()[key]
+        return
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __len__(self):
+        return len(self._current())
+
+    def __contains__(self, key):
+        return key in self._current()
+
+    def get(self, key, default=None):
+        return self._current().get(key, default)
+
+    def clear(self):
+        self._current().clear()
+        return
+
+
 class ConfigManager(ConfigManagerCore):
     """配置管理器类，支持自动保存和类型提示"""
     _production_instances = {}  # 生产模式实例缓存（基于配置路径）
-    _instances = {}  # 多例缓存（测试模式）
-    _thread_lock = threading.Lock()
+    _instances = _TestInstanceRegistry()  # 多例缓存（测试模式），见_TestInstanceRegistry
+    _thread_lock = threading.RLock()  # 可重入：测试模式在持锁期间准备环境并创建实例
     _global_listeners = []
     _initialized = False  # 初始化标志
     _test_mode = False  # 测试模式标志
     _paths_initialized = False  # 路径配置初始化标志
+    _pending_path_update = None  # 批量update期间是否有待更新的路径配置，None表示不在批量更新中
 
     def __new__(cls, config_path: str = None,
                 watch: bool = True, auto_create: bool = False,
@@ -173,12 +247,10 @@ class ConfigManager(ConfigManagerCore):
     def _get_test_identifier(cls) -> str:
         """获取当前测试用例的唯一标识符"""
         try:
-            import inspect
-            
             # 遍历调用栈查找测试函数
-            for frame_info in inspect.stack():
-                function_name = frame_info.function
-                filename = frame_info.filename
+            for frame in _iter_caller_frames():
+                function_name = frame.f_code.co_name
+                filename = frame.f_code.co_filename
                 
                 # 检查是否是测试函数（函数名以test_开头或在测试文件中）
                 if (function_name.startswith('test_') and 
@@ -225,7 +297,7 @@ class ConfigManager(ConfigManagerCore):
         """设置测试环境"""
         # 基于当前工作目录生成测试配置路径
         cwd = os.getcwd()
-        print(f"✓ 基于当前工作目录生成测试路径: {cwd}")
+        logger.debug("✓ 基于当前工作目录生成测试路径: %s", cwd)
         
         # 生成测试环境路径（传递原始配置路径以确保隔离）
         test_base_dir, test_config_path = cls._generate_test_environment_path(first_start_time, original_config_path)
@@ -233,7 +305,7 @@ class ConfigManager(ConfigManagerCore):
         # 设置测试模式环境变量
         os.environ['CONFIG_MANAGER_TEST_MODE'] = 'true'
         os.environ['CONFIG_MANAGER_TEST_BASE_DIR'] = test_base_dir
-        print(f"✓ 开始执行路径替换，test_base_dir: {test_base_dir}, temp_base: {tempfile.gettempdir()}")
+        logger.debug("✓ 开始执行路径替换，test_base_dir: %s, temp_base: %s", test_base_dir, tempfile.gettempdir())
         
         # 确保测试配置目录存在
         os.makedirs(os.path.dirname(test_config_path), exist_ok=True)
@@ -245,7 +317,7 @@ class ConfigManager(ConfigManagerCore):
         if not prod_config_path:
             prod_config_path = cls._detect_production_config()
             if prod_config_path:
-                print(f"✓ 检测到生产配置: {prod_config_path}")
+                logger.debug("✓ 检测到生产配置: %s", prod_config_path)
             else:
                 print("⚠️  未检测到生产配置，将尝试其他方法")
 
@@ -269,7 +341,7 @@ class ConfigManager(ConfigManagerCore):
                         print(f"⚠️  跳过tests目录下的配置文件: {path}")
                         continue
                     prod_config_path = path
-                    print(f"✓ 找到配置文件: {prod_config_path}")
+                    logger.debug("✓ 找到配置文件: %s", prod_config_path)
                     break
 
             # 策略2: 如果还是没找到，尝试向上查找
@@ -295,7 +367,7 @@ class ConfigManager(ConfigManagerCore):
                                 print(f"⚠️  跳过tests目录下的配置文件: {path}")
                                 continue
                             prod_config_path = path
-                            print(f"✓ 在上级目录找到配置文件: {prod_config_path}")
+                            logger.debug("✓ 在上级目录找到配置文件: %s", prod_config_path)
                             break
 
                         if prod_config_path and os.path.exists(prod_config_path):
@@ -307,16 +379,15 @@ class ConfigManager(ConfigManagerCore):
             if not prod_config_path or not os.path.exists(prod_config_path):
                 print("在上级目录未找到，从调用栈查找...")
                 try:
-                    import inspect
-                    for frame_info in inspect.stack():
-                        filename = frame_info.filename
+                    for frame in _iter_caller_frames():
+                        filename = frame.f_code.co_filename
 
                         # 跳过config_manager自身的文件
                         if 'config_manager' in filename:
                             continue
 
-                        # 跳过pytest相关文件
-                        if 'pytest' in filename or '_pytest' in filename:
+                        # 跳过pytest相关文件（包含_pytest）
+                        if 'pytest' in filename:
                             continue
 
                         # 跳过Python标准库文件
@@ -340,7 +411,7 @@ class ConfigManager(ConfigManagerCore):
                                     print(f"⚠️  跳过tests目录下的配置文件: {path}")
                                     continue
                                 prod_config_path = path
-                                print(f"✓ 从调用文件目录找到配置文件: {prod_config_path}")
+                                logger.debug("✓ 从调用文件目录找到配置文件: %s", prod_config_path)
                                 break
 
                             if prod_config_path and os.path.exists(prod_config_path):
@@ -359,7 +430,7 @@ class ConfigManager(ConfigManagerCore):
                         test_path = os.path.join(current_dir, 'src', 'config', 'config.yaml')
                         if os.path.exists(test_path):
                             prod_config_path = test_path
-                            print(f"✓ 从常见项目结构找到配置文件: {prod_config_path}")
+                            logger.debug("✓ 从常见项目结构找到配置文件: %s", prod_config_path)
                             break
                         
                         parent_dir = os.path.dirname(current_dir)
@@ -413,7 +484,7 @@ class ConfigManager(ConfigManagerCore):
         pytest_tmp_path = cls._detect_pytest_tmp_path()
         if pytest_tmp_path:
             test_base_dir = pytest_tmp_path
-            print(f"✓ 检测到pytest环境，使用pytest tmp_path: {test_base_dir}")
+            logger.debug("✓ 检测到pytest环境，使用pytest tmp_path: %s", test_base_dir)
         else:
             # 基于当前工作目录和原始配置路径生成唯一的测试目录
             # 使用当前工作目录的哈希值来确保不同目录生成不同的路径
@@ -441,11 +512,11 @@ class ConfigManager(ConfigManagerCore):
                 unique_id = f"{cwd_hash}_{microsecond_str}_{stability_hash}"
                 
             test_base_dir = os.path.join(tempfile.gettempdir(), 'tests', date_str, time_str, unique_id)
-            print(f"✓ 基于当前工作目录生成测试路径: {test_base_dir}")
+            logger.debug("✓ 基于当前工作目录生成测试路径: %s", test_base_dir)
         
         test_config_path = os.path.join(test_base_dir, 'src', 'config', 'config.yaml')
         
-        print(f"✓ 开始执行路径替换，test_base_dir: {test_base_dir}, temp_base: {tempfile.gettempdir()}")
+        logger.debug("✓ 开始执行路径替换，test_base_dir: %s, temp_base: %s", test_base_dir, tempfile.gettempdir())
         return test_base_dir, test_config_path
 
     @classmethod
@@ -530,7 +601,7 @@ class ConfigManager(ConfigManagerCore):
             return True
             
         # 检查是否在项目根目录的config目录中
-        if abs_config_path.endswith('/config/config.yaml') or abs_config_path.endswith('\\config\\config.yaml'):
+        if abs_config_path.endswith(('/config/config.yaml', '\\config\\config.yaml')):
             return True
             
         return False
@@ -538,26 +609,23 @@ class ConfigManager(ConfigManagerCore):
     @classmethod
     def _copy_production_config_to_test(cls, prod_config_path: str, test_config_path: str,
                                         first_start_time: datetime = None, project_name: str = None):
-        """将生产配置复制到测试环境"""
-        # 确保测试目录存在
-        os.makedirs(os.path.dirname(test_config_path), exist_ok=True)
-
+        """将生产配置复制到测试环境（测试配置目录已由_setup_test_environment创建）"""
         # 判断是否是真正的生产配置（在项目标准位置）
         is_production_config = cls._is_production_config_path(prod_config_path)
 
         if os.path.exists(prod_config_path):
             # 检查源路径和目标路径是否相同
             if os.path.abspath(prod_config_path) == os.path.abspath(test_config_path):
-                print(f"✓ 源路径和目标路径相同，跳过复制: {prod_config_path}")
+                logger.debug("✓ 源路径和目标路径相同，跳过复制: %s", prod_config_path)
                 # 直接更新现有配置
                 cls._update_test_config_paths(test_config_path, first_start_time, project_name, from_production=is_production_config)
             else:
                 # 复制配置文件（添加重试机制处理Windows文件锁定）
                 cls._safe_copy_file(prod_config_path, test_config_path)
                 if is_production_config:
-                    print(f"✓ 已从生产环境复制配置: {prod_config_path} -> {test_config_path}")
+                    logger.debug("✓ 已从生产环境复制配置: %s -> %s", prod_config_path, test_config_path)
                 else:
-                    print(f"✓ 已从自定义配置复制: {prod_config_path} -> {test_config_path}")
+                    logger.debug("✓ 已从自定义配置复制: %s -> %s", prod_config_path, test_config_path)
 
                 # 修改测试配置中的路径信息
                 cls._update_test_config_paths(test_config_path, first_start_time, project_name, from_production=is_production_config)
@@ -621,6 +689,11 @@ class ConfigManager(ConfigManagerCore):
             # 对于其他类型，直接替换
             return new_data
 
+    @classmethod
+    def _get_test_base_dir(cls, test_config_path: str) -> str:
+        """获取测试配置对应的测试基础目录"""
+        return _derive_test_base_dir(test_config_path)
+
     @classmethod
     def _update_test_config_paths(cls, test_config_path: str, first_start_time: datetime = None,
                                   project_name: str = None, from_production: bool = False):
@@ -660,10 +733,10 @@ class ConfigManager(ConfigManagerCore):
             if first_start_time:
                 # 优先使用传入的参数
                 time_to_use = first_start_time
-                print(f"✓ 使用传入的first_start_time: {first_start_time}")
+                logger.debug("✓ 使用传入的first_start_time: %s", first_start_time)
             elif original_first_start_time:
                 # 保留原配置中的时间，但需要确保类型注释正确
-                print(f"✓ 保留原配置中的first_start_time: {original_first_start_time}")
+                logger.debug("✓ 保留原配置中的first_start_time: %s", original_first_start_time)
                 time_to_use = None  # 标记不需要更新时间值
                 
                 # 确保 __type_hints__ 中包含 first_start_time 的类型注释
@@ -679,15 +752,14 @@ class ConfigManager(ConfigManagerCore):
             else:
                 # 只有在都没有的情况下才使用当前时间
                 time_to_use = datetime.now()
-                print(f"✓ 使用当前时间作为first_start_time: {time_to_use}")
+                logger.debug("✓ 使用当前时间作为first_start_time: %s", time_to_use)
 
             # 生成测试环境的基础路径
-            test_base_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(test_config_path)))  # 去掉 /src/config/config.yaml
+            test_base_dir = cls._get_test_base_dir(test_config_path)
             temp_base = tempfile.gettempdir()
 
             # 无论如何都要执行路径替换
-            print(f"✓ 开始执行路径替换，test_base_dir: {test_base_dir}, temp_base: {temp_base}")
+            logger.debug("✓ 开始执行路径替换，test_base_dir: %s, temp_base: %s", test_base_dir, temp_base)
 
             # 直接在原始的YAML数据上进行更新，保留注释
             # 确定使用的project_name（优先级：传入参数 > 原配置 > 默认值 'project_name'）
@@ -760,7 +832,7 @@ class ConfigManager(ConfigManagerCore):
                 yaml = YAML()
                 with open(test_config_path, 'w', encoding='utf-8') as f:
                     yaml.dump(basic_config, f)
-                print("✓ 已创建基本配置文件")
+                logger.debug("✓ 已创建基本配置文件")
 
             except Exception as e2:
                 print(f"⚠️  创建基本配置文件也失败: {e2}")
@@ -768,10 +840,7 @@ class ConfigManager(ConfigManagerCore):
     @classmethod
     def _create_empty_test_config(cls, test_config_path: str, first_start_time: datetime = None,
                                   project_name: str = None):
-        """创建空的测试配置"""
-        # 确保测试目录存在
-        os.makedirs(os.path.dirname(test_config_path), exist_ok=True)
-
+        """创建空的测试配置（测试配置目录已由_setup_test_environment创建）"""
         # 确定使用的时间
         if first_start_time:
             time_to_use = first_start_time
@@ -985,17 +1054,58 @@ __type_hints__:
         if key == 'base_dir' and isinstance(value, str):
             value = convert_to_multi_platform_config(value, 'base_dir')
 
-        # 设置值
-        super().set(key, value, type_hint=type_hint)
+        # 值未变化时跳过写入和路径配置更新，仍按autosave参数安排保存
+        if type_hint is None and self._is_unchanged_value(key, value):
+            if autosave:
+                self._schedule_autosave()
+            return
 
-        # 如果是路径相关配置，更新路径配置
+        # 设置值（自动保存统一在下方按autosave参数安排）
+        super().set(key, value, autosave=False, type_hint=type_hint)
+
+        # 如果是路径相关配置，更新路径配置（批量更新时推迟到全部写入之后）
         if self._should_update_path_config(key):
-            self._update_path_configuration()
+            if self._pending_path_update is None:
+                self._update_path_configuration()
+            else:
+                self._pending_path_update = True
 
         # 安排自动保存
         if autosave:
             self._schedule_autosave()
 
+    def _is_unchanged_value(self, key: str, value: Any) -> bool:
+        """判断顶层键的新值是否与现有值相同
+
+        只比较标量和多平台字典这类可以直接判等的值；嵌套键、类型不同的值一律视为变化。
+        """
+        if '.' in key or key not in self._data:
+            return False
+        existing = self._data[key]
+        if hasattr(existing, 'to_dict'):
+            # 多平台配置等ConfigNode与转换后的字典比较
+            return isinstance(value, dict) and existing.to_dict() == value
+        return (type(existing) is type(value) and isinstance(value, (str, int, float, bool))
+                and existing == value)
+
+    def update(self, *args, save: bool = False, autosave: bool = True, **kwargs):
+        """批量更新配置值，路径相关配置在全部写入后只重新生成一次
+
+        save=True时在路径配置重新生成之后再保存，保证写入文件的路径是最新的。
+        """
+        self._pending_path_update = False
+        try:
+            super().update(*args, autosave=autosave and not save, **kwargs)
+        finally:
+            needs_path_update = self._pending_path_update
+            self._pending_path_update = None
+            # 即使中途某个键写入失败，已写入的base_dir/project_name等也要生成对应路径
+            if needs_path_update:
+                self._update_path_configuration()
+        if save:
+            self.save()
+        return
+
     def cleanup(self):
         """清理所有资源，停止线程并关闭文件"""
         try:
@@ -1009,9 +1119,7 @@ __type_hints__:
                 
         except Exception as e:
             # 在清理过程中忽略错误，避免影响程序退出
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"清理资源时发生错误: {e}")
+            logger.debug("清理资源时发生错误: %s", e)
         return
 
     def __enter__(self):
@@ -1075,17 +1183,32 @@ def get_config_manager(
         cache_key = ConfigManager._generate_test_cache_key(original_config_path, first_start_time)
         
         # 如果缓存中已有实例，直接返回
-        if cache_key in ConfigManager._instances:
-            return ConfigManager._instances[cache_key]
+        cached = ConfigManager._instances.get(cache_key)
+        if cached is not None:
+            return cached
         
         # 缓存中没有，才生成测试环境路径并创建实例
-        test_config_path = ConfigManager._setup_test_environment(original_config_path, first_start_time)
-        # 直接调用_create_test_instance，传入正确的缓存键避免重复计算
-        return ConfigManager._create_test_instance(
-            test_config_path, watch, True, autosave_delay, first_start_time, 
-            original_config_path, cache_key
-        )
+        # 持锁完成环境准备和实例创建，并发的相同请求只准备一次环境、解析一次配置
+        with ConfigManager._thread_lock:
+            cached = ConfigManager._instances.get(cache_key)
+            if cached is not None:
+                return cached
+
+            test_config_path = ConfigManager._setup_test_environment(original_config_path, first_start_time)
+            # 直接调用_create_test_instance，传入正确的缓存键避免重复计算
+            return ConfigManager._create_test_instance(
+                test_config_path, watch, True, autosave_delay, first_start_time, 
+                original_config_path, cache_key
+            )
     else:
+        # 生产模式快速路径：相同配置路径的实例已缓存且初始化完成时直接返回，
+        # 不再重复做临时目录检测和实例构造
+        cached = ConfigManager._production_instances.get(
+            ConfigManager._generate_production_cache_key(config_path))
+        if cached is not None and getattr(cached, '_paths_initialized', False):
+            ConfigManager._test_mode = False
+            return cached
+
         # 非测试模式：智能检测测试环境 - 如果配置路径包含临时目录，自动启用auto_create
         if config_path and not auto_create:
             import tempfile
@@ -1096,7 +1219,7 @@ def get_config_manager(
                     '\\temp\\' in config_path.lower() or
                     'tmpdir' in config_path.lower()):
                 auto_create = True
-                print(f"✓ 检测到测试环境，自动启用auto_create: {config_path}")
+                logger.debug("✓ 检测到测试环境，自动启用auto_create: %s", config_path)
 
     # 在测试模式下传递原始配置路径
     if test_mode:
@@ -1115,19 +1238,25 @@ def get_config_manager(
 
 
 def _clear_instances_for_testing():
-    """清理所有实例，仅用于测试"""
+    """清理所有实例，仅用于测试
+
+    在isolated_test_instances()中调用时只清理当前上下文的测试模式实例，
+    进程共享的生产模式实例和类级初始化标记保持不变。
+    """
+    isolated = _test_instances_var.get(None) is not None
     with ConfigManager._thread_lock:
-        # 清理生产模式实例
-        for instance in ConfigManager._production_instances.values():
-            if hasattr(instance, '_cleanup'):
-                try:
-                    instance._cleanup()
-                except Exception:
-                    pass  # 忽略清理过程中的错误
-        ConfigManager._production_instances.clear()
-        ConfigManager._initialized = False
-        ConfigManager._paths_initialized = False
-        
+        # 清理生产模式实例（隔离上下文中跳过，避免拆掉并行测试的实例）
+        if not isolated:
+            for instance in ConfigManager._production_instances.values():
+                if hasattr(instance, '_cleanup'):
+                    try:
+                        instance._cleanup()
+                    except Exception:
+                        pass  # 忽略清理过程中的错误
+            ConfigManager._production_instances.clear()
+            ConfigManager._initialized = False
+            ConfigManager._paths_initialized = False
+
         # 清理测试模式实例
         for instance in ConfigManager._instances.values():
             if hasattr(instance, '_cleanup'):
@@ -1143,6 +1272,29 @@ def _clear_instances_for_testing():
     return
 
 
+@contextlib.contextmanager
+def isolated_test_instances():
+    """在当前上下文中使用独立的测试模式实例缓存，仅用于测试
+
+    with块内创建的测试模式实例只对当前上下文（线程/协程）可见，
+    _clear_instances_for_testing()也只清理这些实例；退出时清理并恢复共享缓存。
+    """
+    token = _test_instances_var.set({})
+    try:
+        yield
+    finally:
+        with ConfigManager._thread_lock:
+            for instance in ConfigManager._instances.values():
+                if hasattr(instance, '_cleanup'):
+                    try:
+                        instance._cleanup()
+                    except Exception:
+                        pass  # 忽略清理过程中的错误
+            ConfigManager._instances.clear()
+        _test_instances_var.reset(token)
+    return
+
+
 def debug_instances():
     """调试方法：显示当前所有实例信息"""
     with ConfigManager._thread_lock:
@@ -8,6 +8,10 @@ from typing import Any, Dict, List
 
 start_time = datetime.now()
 
+# 需要在__getattr__中特殊处理的属性名，其余键可以直接返回
+_SPECIAL_ATTRS = frozenset(('debug_mode', 'first_start_time', 'paths'))
+_MISSING = object()
+
 
 class ConfigNode:
     """配置节点类，支持点操作访问"""
@@ -38,6 +42,14 @@ class ConfigNode:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
         data = super().__getattribute__('_data')
+
+        # 快速路径：普通键且值无需转换时直接返回，只做一次字典查找
+        if name not in _SPECIAL_ATTRS:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+            if not isinstance(value, dict):
+                return value
         
         # 特殊处理debug_mode：总是动态调用is_debug()，不使用配置文件中的值
         if name == 'debug_mode':
@@ -12,13 +12,19 @@ logger = logging.getLogger(__name__)
 
 
 class AutosaveManager:
-    """自动保存管理器"""
+    """自动保存管理器
+
+    延迟窗口内的多次修改合并为一次保存：已有定时器等待时只标记有待保存的修改，
+    不再反复取消和创建定时器线程。
+    """
 
     def __init__(self, autosave_delay: float):
         self._autosave_delay = autosave_delay
         self._autosave_timer = None
         self._autosave_lock = threading.Lock()
         self._shutdown = False
+        self._dirty = False  # 是否有尚未保存的修改
+        self._save_callback = None
 
     def schedule_save(self, save_callback: Callable[[], bool]):
         """安排自动保存任务"""
@@ -30,25 +36,35 @@ class AutosaveManager:
             # 再次检查状态（防止在获取锁的过程中状态发生变化）
             if self._shutdown or self._is_interpreter_shutting_down():
                 return
-                
+
+            self._dirty = True
+            self._save_callback = save_callback
+
+            # 已有定时器在等待，本次修改合并到同一次保存
             if self._autosave_timer:
-                self._autosave_timer.cancel()
+                return
 
-            try:
-                self._autosave_timer = threading.Timer(
-                    self._autosave_delay,
-                    self._perform_autosave,
-                    args=(save_callback,)
-                )
-                self._autosave_timer.daemon = True
-                self._autosave_timer.start()
-            except RuntimeError as e:
-                # 如果无法创建线程（比如解释器关闭），忽略错误
-                if "can't create new thread at interpreter shutdown" in str(e):
-                    self._shutdown = True
-                    return
-                else:
-                    raise
+            self._start_timer(save_callback)
+        return
+
+    def _start_timer(self, save_callback: Callable[[], bool]):
+        """启动自动保存定时器，调用方需持有_autosave_lock"""
+        try:
+            self._autosave_timer = threading.Timer(
+                self._autosave_delay,
+                self._perform_autosave,
+                args=(save_callback,)
+            )
+            self._autosave_timer.daemon = True
+            self._autosave_timer.start()
+        except RuntimeError as e:
+            self._autosave_timer = None
+            # 如果无法创建线程（比如解释器关闭），忽略错误
+            if "can't create new thread at interpreter shutdown" in str(e):
+                self._shutdown = True
+                return
+            else:
+                raise
         return
 
     def _is_interpreter_shutting_down(self) -> bool:
@@ -68,7 +84,10 @@ class AutosaveManager:
             # 检查是否在关闭状态
             if self._shutdown or self._is_interpreter_shutting_down():
                 return
-                
+
+            with self._autosave_lock:
+                self._dirty = False
+
             saved = save_callback()
             if saved:
                 logger.info("配置已自动保存")
@@ -79,12 +98,20 @@ class AutosaveManager:
         finally:
             with self._autosave_lock:
                 self._autosave_timer = None
+                # 保存期间又有新的修改，再安排一次保存
+                if (self._dirty and self._save_callback is not None and
+                        not self._shutdown and not self._is_interpreter_shutting_down()):
+                    try:
+                        self._start_timer(self._save_callback)
+                    except RuntimeError as e:
+                        logger.error(f"重新安排自动保存失败: {str(e)}")
         return
 
     def cleanup(self):
         """清理自动保存定时器"""
         self._shutdown = True
         with self._autosave_lock:
+            self._dirty = False
             if self._autosave_timer:
                 self._autosave_timer.cancel()
                 self._autosave_timer = None
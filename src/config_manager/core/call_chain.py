@@ -3,29 +3,53 @@ from __future__ import annotations
 from datetime import datetime
 
 import os
-import inspect
+import re
+import sys
 import threading
-import asyncio
+
+
+# 标准库路径匹配（忽略大小写，模块加载时编译一次）
+_STDLIB_PATH_RE = re.compile(r'lib[/\\]python', re.IGNORECASE)
+
+# 代码文件名 -> 模块名缓存，避免每帧访问f_globals
+_MODULE_CACHE: dict[str, str] = {}
+
+
+def _get_module_name(frame) -> str:
+    """获取帧所属模块名，按代码文件名缓存"""
+    filename = frame.f_code.co_filename
+    module_name = _MODULE_CACHE.get(filename)
+    if module_name is None:
+        module_name = frame.f_globals.get('__name__', 'unknown')
+        # __main__和<string>等动态代码的文件名不唯一对应模块，不缓存
+        if module_name != '__main__' and not filename.startswith('<'):
+            _MODULE_CACHE[filename] = module_name
+    return module_name
+
+
+def _iter_frames(frame):
+    """沿f_back遍历调用帧，不读取源码上下文"""
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
 
 
 class CallChainTracker:
     """完整调用链追踪器 - 显示所有调用，不跳过任何情况"""
 
+    __slots__ = ()
+
     def get_call_chain(self) -> str:
         """获取完整的调用链信息"""
         try:
             # 获取环境信息
             env_info = self._get_environment_info()
 
-            # 获取完整调用栈
-            stack = inspect.stack()
-            call_parts = []
-
             # 从第1个开始（跳过当前方法），显示所有调用
-            for i in range(1, len(stack)):
-                frame_info = stack[i]
-                call_info = self._format_call_info(frame_info, i)
-                call_parts.append(call_info)
+            call_parts = [
+                self._format_call_info(frame, i)
+                for i, frame in enumerate(_iter_frames(sys._getframe(1)), start=1)
+            ]
 
             if not call_parts:
                 return f"[{env_info}] 无调用链"
@@ -60,6 +84,11 @@ class CallChainTracker:
 
     def _get_async_info(self) -> str:
         """获取异步信息"""
+        # 未导入asyncio时不可能有运行中的事件循环，不必为此导入asyncio
+        asyncio = sys.modules.get('asyncio')
+        if asyncio is None:
+            return "A:Sync"
+
         try:
             loop = asyncio.get_running_loop()
             loop_id = id(loop) % 10000
@@ -81,16 +110,16 @@ class CallChainTracker:
         except Exception:
             return "A:Err"
 
-    def _format_call_info(self, frame_info: inspect.FrameInfo, index: int) -> str:
+    def _format_call_info(self, frame, index: int) -> str:
         """格式化调用信息 - 显示所有详细信息"""
         try:
-            filename = frame_info.filename
-            function_name = frame_info.function
-            line_number = frame_info.lineno
+            code = frame.f_code
+            filename = code.co_filename
+            function_name = code.co_name
+            line_number = frame.f_lineno
 
             # 获取模块名
-            frame = frame_info.frame
-            module_name = frame.f_globals.get('__name__', 'unknown')
+            module_name = _get_module_name(frame)
 
             # 简化路径但保留关键信息
             simplified_path = self._simplify_path(filename)
@@ -116,6 +145,8 @@ class CallChainTracker:
 
     def _simplify_path(self, filepath: str) -> str:
         """简化路径显示"""
+        # 只用于显示的文件名，rpartition一次扫描即可
+        basename = filepath.rpartition(os.sep)[2]
         try:
             if 'site-packages' in filepath:
                 # 第三方包
@@ -123,15 +154,15 @@ class CallChainTracker:
                 if len(parts) > 1:
                     pkg_path = parts[-1].strip(os.sep)
                     return f"pkg/{pkg_path.replace(os.sep, '/')}"
-                return f"pkg/{os.path.basename(filepath)}"
+                return f"pkg/{basename}"
 
-            elif any(lib in filepath.lower() for lib in ['lib/python', 'lib\\python']):
+            elif _STDLIB_PATH_RE.search(filepath):
                 # 标准库
-                return f"std/{os.path.basename(filepath)}"
+                return f"std/{basename}"
 
             elif 'asyncio' in filepath:
                 # 异步库
-                return f"async/{os.path.basename(filepath)}"
+                return f"async/{basename}"
 
             else:
                 # 用户代码
@@ -141,12 +172,12 @@ class CallChainTracker:
                         rel_path = os.path.relpath(filepath, cwd)
                         return f"usr/{rel_path.replace(os.sep, '/')}"
                     else:
-                        return f"ext/{os.path.basename(filepath)}"
+                        return f"ext/{basename}"
                 except (OSError, ValueError, TypeError):
-                    return f"usr/{os.path.basename(filepath)}"
+                    return f"usr/{basename}"
 
         except Exception:
-            return os.path.basename(filepath)
+            return basename
 
     def _get_context_info(self, frame) -> str:
         """获取帧上下文信息"""
@@ -183,12 +214,11 @@ class CallChainTracker:
     def get_caller_start_time(self) -> datetime:
         """获取调用模块的start_time变量，优先查找非config_manager内部模块"""
         try:
-            stack = inspect.stack()
+            frames = list(_iter_frames(sys._getframe(0)))
             found_start_times = []
 
             # 收集所有模块中的start_time，记录模块信息和优先级
-            for frame_info in stack:
-                frame = frame_info.frame
+            for frame in frames:
                 frame_globals = frame.f_globals
                 module_name = frame_globals.get('__name__', '')
 
@@ -207,10 +237,8 @@ class CallChainTracker:
 
                     if parsed_time is not None:
                         # 判断模块优先级
-                        is_config_manager_module = (
-                                module_name.startswith('config_manager') or
-                                module_name.startswith('src.config_manager')
-                        )
+                        is_config_manager_module = module_name.startswith(
+                            ('config_manager', 'src.config_manager'))
 
                         found_start_times.append({
                             'time': parsed_time,
@@ -237,8 +265,8 @@ class CallChainTracker:
                     if internal_times:
                         # 检查调用栈中是否有明确的测试模块调用
                         has_test_module = any(
-                            'test' in frame_info.frame.f_globals.get('__name__', '').lower()
-                            for frame_info in stack
+                            'test' in frame.f_globals.get('__name__', '').lower()
+                            for frame in frames
                         )
 
                         if has_test_module:
@@ -266,22 +294,26 @@ class CallChainTracker:
     def get_detailed_call_info(self) -> dict:
         """获取详细的调用信息用于调试"""
         try:
-            stack = inspect.stack()
+            frames = list(_iter_frames(sys._getframe(0)))
             return {
                 'environment': self._get_environment_info(),
-                'total_frames': len(stack),
+                'total_frames': len(frames),
                 'frames': [
                     {
                         'index': i,
-                        'module': frame.frame.f_globals.get('__name__', 'unknown'),
-                        'filename': frame.filename,
-                        'function': frame.function,
-                        'line': frame.lineno,
-                        'simplified_path': self._simplify_path(frame.filename),
-                        'context': self._get_context_info(frame.frame)
+                        'module': _get_module_name(frame),
+                        'filename': frame.f_code.co_filename,
+                        'function': frame.f_code.co_name,
+                        'line': frame.f_lineno,
+                        'simplified_path': self._simplify_path(frame.f_code.co_filename),
+                        'context': self._get_context_info(frame)
                     }
-                    for i, frame in enumerate(stack)
+                    for i, frame in enumerate(frames)
                 ]
             }
         except Exception as e:
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
+
+
+# 进程内共享的调用链追踪器，所有配置管理器实例共用
+GLOBAL_TRACKER = CallChainTracker()
@@ -140,40 +140,17 @@ class CrossPlatformPathManager:
         if not path:
             return self._get_default_paths(key)
         
-        # 检测路径的平台类型
-        detected_platform = self._detect_path_platform(path)
-        
-        # 创建多平台配置
-        multi_platform_config = {}
-        
-        # 为每个支持的平台设置路径
-        for platform_name in ['windows', 'linux']:
-            if platform_name == detected_platform:
-                # 对于检测到的平台，使用原始路径
-                multi_platform_config[platform_name] = path
+        # 检测路径的平台类型，检测到的平台使用原始路径，另一平台生成对应路径
+        if self._detect_path_platform(path) == 'windows':
+            # 从Windows路径转换为Linux路径：base_dir使用默认的~/logs，其他路径类型尝试转换
+            if key == 'base_dir':
+                linux_path = '~/logs'
             else:
-                # 对于其他平台，生成对应的路径
-                if platform_name == 'windows':
-                    # Windows路径转换
-                    if detected_platform in ['linux']:
-                        # 从Unix路径转换为Windows路径，默认使用 d:\logs
-                        multi_platform_config[platform_name] = 'd:\\logs'
-                    else:
-                        multi_platform_config[platform_name] = path
-                elif platform_name == 'linux':
-                    # Linux路径转换
-                    if detected_platform == 'windows':
-                        # 从Windows路径转换为Linux路径，保持原始路径转换逻辑
-                        # 只有在没有配置或者需要默认值时才使用~/logs
-                        if key == 'base_dir':
-                            multi_platform_config[platform_name] = '~/logs'
-                        else:
-                            # 对于其他路径类型，尝试转换
-                            multi_platform_config[platform_name] = path.replace('\\', '/').replace('d:', '/tmp')
-                    else:
-                        multi_platform_config[platform_name] = path
-        
-        return multi_platform_config
+                linux_path = path.replace('\\', '/').replace('d:', '/tmp')
+            return {'windows': path, 'linux': linux_path}
+
+        # 从Unix路径转换为Windows路径，默认使用 d:\logs
+        return {'windows': 'd:\\logs', 'linux': path}
     
     def _detect_path_platform(self, path: str) -> str:
         """检测路径的平台类型"""
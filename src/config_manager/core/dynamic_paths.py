@@ -91,6 +91,9 @@ class DynamicPathProperty:
     def _generate_path(self, obj: Any) -> str:
         """生成TSB日志路径
         
+        路径只由(work_dir, first_start_time)决定，结果冻结在节点上，
+        两者都未变化时直接返回，不再重复解析时间和拼接路径。
+        
         Args:
             obj: PathsConfigNode实例
             
@@ -103,23 +106,37 @@ class DynamicPathProperty:
             raise ValueError("work_dir未设置，无法生成tsb_logs_dir")
         
         # 获取配置管理器的first_start_time
+        first_start_time = None
         config_manager = self._get_config_manager(obj)
         if config_manager:
             try:
                 first_start_time = config_manager.first_start_time
+            except AttributeError:
+                first_start_time = None
+        
+        frozen = obj.__dict__.get('_frozen_tsb_logs_dir')
+        if frozen is not None and frozen[0] == work_dir and frozen[1] == first_start_time:
+            return frozen[2]
+        
+        if first_start_time is not None:
+            try:
                 if isinstance(first_start_time, str):
                     timestamp = datetime.fromisoformat(first_start_time.replace("Z", "+00:00"))
                 elif isinstance(first_start_time, datetime):
                     timestamp = first_start_time
                 else:
                     timestamp = None
-            except (AttributeError, ValueError):
+            except ValueError:
                 timestamp = None
         else:
             timestamp = None
         
         # 使用PathResolver生成路径
-        return PathResolver.generate_tsb_logs_path(work_dir, timestamp)
+        path = PathResolver.generate_tsb_logs_path(work_dir, timestamp)
+        # 没有固定时间时路径取决于当前时间，不能冻结
+        if timestamp is not None:
+            obj._frozen_tsb_logs_dir = (work_dir, first_start_time, path)
+        return path
     
     def _get_config_manager(self, obj: Any) -> Optional[Any]:
         """获取配置管理器实例
@@ -2,8 +2,17 @@
 from __future__ import annotations
 from datetime import datetime
 
+import io
 import os
+import copy
+import json
+import pickle
+import shutil
+import hashlib
 import logging
+import tempfile
+import threading
+from collections import OrderedDict
 from ruamel.yaml import YAML
 from typing import Dict, Any, Optional
 from ..utils import lock_file, unlock_file
@@ -14,6 +23,22 @@ logger = logging.getLogger(__name__)
 class FileOperations:
     """文件操作管理器"""
 
+    # JSON旁路文件开关：开启后每次保存额外写入 <配置路径>.json，其中记录写入时YAML的
+    # (mtime_ns, 大小)；加载时YAML签名与记录完全一致才直接读取JSON，YAML仍是唯一的编辑源
+    FAST_JSON_IO = False
+
+    # pickle缓存开关：开启后每次保存额外写入 <配置路径>.cache.pkl，可表示datetime等JSON
+    # 无法表示的值；与JSON旁路文件一样记录YAML签名，签名完全一致时才直接反序列化。pickle加载可执行任意代码，
+    # 只应在配置目录本身可信时开启
+    FAST_PICKLE_IO = False
+
+    # 解析结果缓存：(绝对路径, mtime_ns, 大小, inode) -> 解析后的YAML数据，按LRU淘汰
+    # 文件未变化时重复加载直接返回缓存结果，跳过读取和解析。缓存数据由各实例共享、
+    # 只读使用，需要原地修改时（保存前合并新数据）再复制，见_own_original_yaml_data
+    PARSE_CACHE_SIZE = 100
+    _parse_cache: OrderedDict = OrderedDict()
+    _parse_cache_lock = threading.Lock()
+
     def __init__(self):
         """初始化文件操作管理器"""
         # 创建YAML实例，配置为保留注释和格式
@@ -26,7 +51,11 @@ class FileOperations:
 
         # 存储原始YAML结构以保留注释
         self._original_yaml_data = None
+        self._original_yaml_shared = False  # 原始结构是否与解析缓存共享（写时复制）
         self._config_path = None
+
+        # 备份路径 -> 最近一次写入内容的摘要，内容未变化时跳过重复备份
+        self._backup_digests = {}
         return
 
     def load_config(self, config_path: str, auto_create: bool, call_chain_tracker) -> Optional[Dict]:
@@ -54,7 +83,29 @@ class FileOperations:
                 print(f"配置文件不存在: {config_path}")
                 return None
 
+        # JSON旁路文件快速路径
+        sidecar_data = self._load_json_sidecar(config_path)
+        if sidecar_data is None:
+            sidecar_data = self._load_pickle_cache(config_path)
+        if sidecar_data is not None:
+            self._validate_yaml_types(sidecar_data, config_path)
+            # 原始YAML结构留到首次保存时再按需读取，以保留注释
+            self._original_yaml_data = None
+            self._config_path = None
+            print(f"配置已从 {config_path} 加载")
+            return sidecar_data
+
         try:
+            cache_key = self._get_parse_cache_key(config_path)
+            loaded_data = self._get_cached_parse(cache_key)
+            if loaded_data is not None:
+                # 保存原始YAML结构和路径，用于后续保存时保留注释
+                self._original_yaml_data = loaded_data
+                self._original_yaml_shared = True
+                self._config_path = config_path
+                print(f"配置已从 {config_path} 加载")
+                return loaded_data
+
             with open(config_path, 'r', encoding='utf-8') as f:
                 lock_file(f)
                 try:
@@ -81,9 +132,11 @@ class FileOperations:
                     
                     # 验证YAML数据类型的正确性
                     self._validate_yaml_types(loaded_data, config_path)
+                    self._put_cached_parse(cache_key, loaded_data)
 
                     # 保存原始YAML结构和路径，用于后续保存时保留注释
                     self._original_yaml_data = loaded_data
+                    self._original_yaml_shared = cache_key is not None
                     self._config_path = config_path
                 finally:
                     unlock_file(f)
@@ -124,28 +177,18 @@ class FileOperations:
             # 准备要保存的数据
             data_to_save = self._prepare_data_for_save(config_path, data)
 
-            tmp_original_path = f"{config_path}.tmp"
-            with open(tmp_original_path, 'w', encoding='utf-8') as f:
-                self._yaml.dump(data_to_save, f)
+            # 只序列化一次，并在写入前删除重复键，主配置和备份共用同一份文本
+            yaml_text = self._remove_duplicate_keys_from_yaml_text(self._dump_to_text(data_to_save))
 
-            # 后处理：删除YAML文件中的重复键
-            self._remove_duplicate_keys_from_yaml_file(tmp_original_path)
-
-            os.replace(tmp_original_path, config_path)
+            self._atomic_write_text(config_path, yaml_text)
+            self._write_json_sidecar(config_path, data_to_save)
+            self._write_pickle_cache(config_path, data_to_save)
 
             # 创建备份（如果提供了备份路径）
             if backup_path:
                 try:
-                    backup_dir = os.path.dirname(backup_path)
-                    if backup_dir:
-                        os.makedirs(backup_dir, exist_ok=True)
-
-                    tmp_backup_path = f"{backup_path}.tmp"
-                    with open(tmp_backup_path, 'w', encoding='utf-8') as f:
-                        self._yaml.dump(data_to_save, f)
-
-                    os.replace(tmp_backup_path, backup_path)
-                    print(f"配置已自动备份到 {backup_path}")
+                    if self._write_backup_text(backup_path, yaml_text):
+                        print(f"配置已自动备份到 {backup_path}")
                 except Exception as backup_error:
                     print(f"备份保存失败（不影响主配置文件）: {str(backup_error)}")
 
@@ -165,11 +208,9 @@ class FileOperations:
             # 准备要保存的数据
             data_to_save = self._prepare_data_for_save(config_path, data)
 
-            tmp_original_path = f"{config_path}.tmp"
-            with open(tmp_original_path, 'w', encoding='utf-8') as f:
-                self._yaml.dump(data_to_save, f)
-
-            os.replace(tmp_original_path, config_path)
+            self._atomic_write_text(config_path, self._dump_to_text(data_to_save))
+            self._write_json_sidecar(config_path, data_to_save)
+            self._write_pickle_cache(config_path, data_to_save)
             return True
         except Exception as e:
             print(f"保存配置失败: {str(e)}")
@@ -178,25 +219,262 @@ class FileOperations:
     def create_backup_only(self, backup_path: str, data: Dict[str, Any]) -> bool:
         """仅创建备份文件，不保存主配置"""
         try:
-            # 创建备份目录
-            backup_dir = os.path.dirname(backup_path)
-            if backup_dir:
-                os.makedirs(backup_dir, exist_ok=True)
-
             # 转换PathsConfigNode为普通字典
             data_to_save = self._convert_paths_config_nodes(data)
             
             # 创建备份
-            tmp_backup_path = f"{backup_path}.tmp"
-            with open(tmp_backup_path, 'w', encoding='utf-8') as f:
-                self._yaml.dump(data_to_save, f)
-
-            os.replace(tmp_backup_path, backup_path)
+            self._write_backup_text(backup_path, self._dump_to_text(data_to_save))
             return True
         except Exception as e:
             print(f"创建备份失败: {str(e)}")
             return False
 
+    def _dump_to_text(self, data: Any) -> str:
+        """将数据序列化为YAML文本"""
+        buffer = io.StringIO()
+        self._yaml.dump(data, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _atomic_write_text(target_path: str, content: str | bytes) -> None:
+        """原子写入文本文件（content为bytes时按二进制写入）
+
+        先写入目标文件同目录下的唯一临时文件，再用os.replace替换目标文件，
+        并发保存不会共用同一个临时文件，读取方也不会看到写了一半的内容。
+
+        Args:
+            target_path: 目标文件路径
+            content: 文件内容，str按UTF-8写入，bytes原样写入
+        """
+        fd, tmp_path = FileOperations._create_temp_file(target_path)
+        try:
+            if isinstance(content, bytes):
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+            else:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+
+            # 已有文件沿用其权限；新文件的权限在创建时已由内核按umask确定，与open()一致
+            try:
+                shutil.copymode(target_path, tmp_path)
+            except FileNotFoundError:
+                pass
+
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return
+
+    @staticmethod
+    def _create_temp_file(target_path: str) -> tuple[int, str]:
+        """在目标文件同目录下独占创建唯一的临时文件
+
+        与tempfile.mkstemp不同，以0666请求权限，由内核按进程umask屏蔽，
+        新建的配置文件与open()创建的权限一致，且无需临时修改进程umask。
+
+        Returns:
+            tuple[int, str]: 文件描述符和临时文件路径
+        """
+        target_dir = os.path.dirname(target_path)
+        prefix = os.path.join(target_dir, f"{os.path.basename(target_path)}.")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        for _ in range(tempfile.TMP_MAX):
+            tmp_path = f"{prefix}{os.urandom(6).hex()}.tmp"
+            try:
+                return os.open(tmp_path, flags, 0o666), tmp_path
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"无法在 {target_dir or '.'} 中创建临时文件")
+
+    def _write_backup_text(self, backup_path: str, content: str) -> bool:
+        """写入备份文件，内容与上次写入的相同且文件仍存在时跳过
+
+        Returns:
+            bool: 是否实际写入了备份文件
+        """
+        digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        if self._backup_digests.get(backup_path) == digest and os.path.exists(backup_path):
+            return False
+
+        backup_dir = os.path.dirname(backup_path)
+        if backup_dir:
+            os.makedirs(backup_dir, exist_ok=True)
+
+        self._atomic_write_text(backup_path, content)
+        self._backup_digests[backup_path] = digest
+        return True
+
+    @staticmethod
+    def get_json_sidecar_path(config_path: str) -> str:
+        """获取配置文件对应的JSON旁路文件路径"""
+        return f"{config_path}.json"
+
+    @staticmethod
+    def get_pickle_cache_path(config_path: str) -> str:
+        """获取配置文件对应的pickle缓存文件路径"""
+        return f"{config_path}.cache.pkl"
+
+    @staticmethod
+    def _get_parse_cache_key(config_path: str) -> Optional[tuple]:
+        """生成解析缓存键，文件无法stat时返回None"""
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            return None
+        return os.path.abspath(config_path), st.st_mtime_ns, st.st_size, st.st_ino
+
+    @classmethod
+    def _get_cached_parse(cls, cache_key: Optional[tuple]) -> Optional[Dict]:
+        """读取解析缓存，命中时返回共享的缓存数据，调用方不得原地修改"""
+        if cache_key is None:
+            return None
+        with cls._parse_cache_lock:
+            cached = cls._parse_cache.get(cache_key)
+            if cached is not None:
+                cls._parse_cache.move_to_end(cache_key)
+        return cached
+
+    @classmethod
+    def _put_cached_parse(cls, cache_key: Optional[tuple], data: Dict) -> None:
+        """写入解析缓存（不复制，数据此后按只读共享），超过容量时淘汰最久未使用的条目"""
+        if cache_key is None:
+            return
+        with cls._parse_cache_lock:
+            cls._parse_cache[cache_key] = data
+            cls._parse_cache.move_to_end(cache_key)
+            while len(cls._parse_cache) > cls.PARSE_CACHE_SIZE:
+                cls._parse_cache.popitem(last=False)
+        return
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """清空解析缓存"""
+        with cls._parse_cache_lock:
+            cls._parse_cache.clear()
+        return
+
+    @staticmethod
+    def _get_yaml_signature(config_path: str) -> Optional[list]:
+        """获取YAML文件的 [mtime_ns, 大小] 签名，文件无法stat时返回None
+
+        旁路缓存只在签名完全一致时使用。只比较新旧会在YAML被保留旧mtime的方式
+        还原（cp -p、rsync -t、编辑器备份恢复）后继续返回过期数据。
+        """
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def _load_json_sidecar(self, config_path: str) -> Optional[Dict]:
+        """读取JSON旁路文件，未开启、不存在、与YAML签名不符或无法解析时返回None"""
+        if not self.FAST_JSON_IO:
+            return None
+
+        sidecar_path = self.get_json_sidecar_path(config_path)
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(sidecar, dict):
+            return None
+        signature = self._get_yaml_signature(config_path)
+        if signature is None or sidecar.get('yaml_signature') != signature:
+            # YAML在旁路文件写入之后被修改或替换过，以YAML为准
+            return None
+
+        data = sidecar.get('data')
+        return data if isinstance(data, dict) else None
+
+    def _write_json_sidecar(self, config_path: str, data: Dict[str, Any]) -> None:
+        """写入JSON旁路文件，数据无法用JSON表示时删除旧的旁路文件"""
+        if not self.FAST_JSON_IO:
+            return
+
+        sidecar_path = self.get_json_sidecar_path(config_path)
+        signature = self._get_yaml_signature(config_path)
+        try:
+            if signature is None:
+                raise ValueError("YAML文件不存在")
+            content = json.dumps({'yaml_signature': signature, 'data': data}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            # 包含datetime等JSON无法表示的值，回退到YAML加载
+            try:
+                os.remove(sidecar_path)
+            except OSError:
+                pass
+            return
+
+        try:
+            self._atomic_write_text(sidecar_path, content)
+        except OSError as e:
+            logger.debug("写入JSON旁路文件失败: %s", e)
+
+    def _load_pickle_cache(self, config_path: str) -> Optional[Dict]:
+        """读取pickle缓存，未开启、不存在或与YAML签名不符时返回None，无法反序列化时删除缓存文件"""
+        if not self.FAST_PICKLE_IO:
+            return None
+
+        cache_path = self.get_pickle_cache_path(config_path)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except OSError:
+            return None
+        except Exception as e:
+            logger.debug("pickle缓存无法读取，已删除: %s", e)
+            self._remove_quietly(cache_path)
+            return None
+
+        if not isinstance(cached, dict):
+            return None
+        signature = self._get_yaml_signature(config_path)
+        if signature is None or cached.get('yaml_signature') != signature:
+            # YAML在缓存写入之后被修改或替换过，以YAML为准
+            return None
+
+        data = cached.get('data')
+        return data if isinstance(data, dict) else None
+
+    def _write_pickle_cache(self, config_path: str, data: Dict[str, Any]) -> None:
+        """写入pickle缓存，数据无法序列化时删除旧的缓存文件"""
+        if not self.FAST_PICKLE_IO:
+            return
+
+        cache_path = self.get_pickle_cache_path(config_path)
+        signature = self._get_yaml_signature(config_path)
+        if signature is None:
+            self._remove_quietly(cache_path)
+            return
+        try:
+            # 转为普通字典和列表，不把ruamel的注释信息写入缓存
+            cached = {'yaml_signature': signature, 'data': self._convert_paths_config_nodes(data)}
+            content = pickle.dumps(cached, protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self._remove_quietly(cache_path)
+            return
+
+        try:
+            self._atomic_write_text(cache_path, content)
+        except OSError as e:
+            logger.debug("写入pickle缓存失败: %s", e)
+
+    @staticmethod
+    def _remove_quietly(path: str) -> None:
+        """删除文件，文件不存在或无法删除时忽略"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return
+
     def _prepare_data_for_save(self, config_path: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """准备要保存的数据，尽可能保留原始结构和注释"""
         # 首先转换所有PathsConfigNode为普通字典
@@ -208,7 +486,7 @@ class FileOperations:
                 isinstance(self._original_yaml_data, dict)):
 
             # 深度更新原始数据结构
-            updated_data = self._deep_update_yaml_data(self._original_yaml_data.copy(), data)
+            updated_data = self._deep_update_yaml_data(self._own_original_yaml_data(), data)
             return updated_data
         else:
             # 没有原始结构，但如果路径不同，尝试重新加载原始数据
@@ -217,12 +495,22 @@ class FileOperations:
                 # 重新尝试更新
                 if (self._original_yaml_data is not None and
                         isinstance(self._original_yaml_data, dict)):
-                    updated_data = self._deep_update_yaml_data(self._original_yaml_data.copy(), data)
+                    updated_data = self._deep_update_yaml_data(self._own_original_yaml_data(), data)
                     return updated_data
             
             # 没有原始结构，直接返回新数据
             return data
     
+    def _own_original_yaml_data(self) -> Dict:
+        """返回可原地修改的原始YAML结构
+
+        与解析缓存共享时先深拷贝一份归本实例所有（写时复制），只在首次保存时付出复制开销。
+        """
+        if self._original_yaml_shared:
+            self._original_yaml_data = copy.deepcopy(self._original_yaml_data)
+            self._original_yaml_shared = False
+        return self._original_yaml_data.copy()
+
     def _convert_paths_config_nodes(self, data: Any) -> Any:
         """递归转换所有PathsConfigNode为普通字典"""
         if hasattr(data, '_data') and hasattr(data.__class__, '__name__') and data.__class__.__name__ == 'PathsConfigNode':
@@ -503,15 +791,14 @@ class FileOperations:
             # 比较出现异常时，保守起见认为不相同
             return False
     
-    def _remove_duplicate_keys_from_yaml_file(self, file_path: str) -> None:
-        """直接编辑YAML文件，删除重复键，特别处理__data__和顶层的重复情况"""
-        # 检查是否为测试模式，如果是则减少详细日志输出
-        is_test_mode = '/tests/' in file_path or '/tmp/' in file_path
-        # if not is_test_mode:
-        #     print(f"🔧 开始YAML文件后处理: {file_path}")
+    def _remove_duplicate_keys_from_yaml_text(self, content: str) -> str:
+        """删除序列化后YAML文本中的重复键，特别处理__data__和顶层的重复情况
+
+        在写入文件之前处理文本，无需再重新打开已写入的文件。
+        没有需要删除的内容或处理出错时原样返回。
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = io.StringIO(content).readlines()
             
             # if not is_test_mode:
             #     print(f"🔧 读取到 {len(lines)} 行内容")
@@ -701,23 +988,13 @@ class FileOperations:
             
             # 删除标记的行
             if lines_to_remove:
-                filtered_lines = [line for i, line in enumerate(lines) if i not in lines_to_remove]
-                
-                # 写回文件
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(filtered_lines)
-                
-                # if not is_test_mode:
-                #     print(f"✅ 成功删除 {len(lines_to_remove)} 行重复内容")
-            else:
-                # if not is_test_mode:
-                #     print(f"ℹ️  没有发现需要删除的重复键")
-                pass
-                
+                return ''.join(line for i, line in enumerate(lines) if i not in lines_to_remove)
+
         except Exception as e:
             # print(f"❌ 删除重复键时发生错误: {e}")
             import traceback
             traceback.print_exc()
+        return content
     
     def _mark_key_block_for_removal(self, lines: list, start_line: int, base_indent: int, lines_to_remove: set) -> None:
         """标记一个键值对块的所有行为需要删除"""
@@ -771,6 +1048,7 @@ class FileOperations:
                     
                     # 更新原始数据和路径
                     self._original_yaml_data = loaded_data
+                    self._original_yaml_shared = False
                     self._config_path = config_path
                     
         except Exception as e:
@@ -6,7 +6,10 @@ import os
 import threading
 import atexit
 import time
+import copy
 import uuid
+import itertools
+from sys import intern
 from pathlib import Path
 from typing import Any, Dict, Optional, Type
 from collections.abc import Iterable, Mapping
@@ -15,13 +18,21 @@ from .path_resolver import PathResolver
 from .file_operations import FileOperations
 from .autosave_manager import AutosaveManager
 from .watcher import FileWatcher
-from .call_chain import CallChainTracker
+from .call_chain import CallChainTracker, GLOBAL_TRACKER
 from .path_configuration import PathConfigurationManager
 from .cross_platform_paths import convert_to_multi_platform_config, get_platform_path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 路径字段名判断用的关键词，模块加载时构建一次
+_PATH_KEY_KEYWORDS = ('dir', 'path', 'directory', 'folder', 'location', 'root', 'base')
+
+
+def _intern_key(key: Any) -> Any:
+    """驻留字符串键：各实例反复出现的键名共享同一对象，字典查找可按指针比较"""
+    return intern(key) if type(key) is str else key
+
 
 class ConfigManagerCore(ConfigNode):
     """配置管理器核心实现类"""
@@ -35,7 +46,7 @@ class ConfigManagerCore(ConfigNode):
         self._file_ops = None
         self._autosave_manager = None
         self._watcher = None
-        self._call_chain_tracker = None
+        self._call_chain_tracker = GLOBAL_TRACKER
         self._path_config_manager = None
 
         # 基本属性
@@ -136,13 +147,14 @@ class ConfigManagerCore(ConfigNode):
         self._file_ops = FileOperations()
         self._autosave_manager = AutosaveManager(autosave_delay)
         self._watcher = FileWatcher() if watch else None
-        self._call_chain_tracker = CallChainTracker()
+        # 所有实例共用进程级调用链追踪器，不再为每个实例单独创建
+        self._call_chain_tracker = GLOBAL_TRACKER
 
         # 根据开关决定是否测试调用链追踪器
         if ENABLE_CALL_CHAIN_DISPLAY:
             print("=== 调用链追踪器测试 ===")
             try:
-                test_chain = self._call_chain_tracker.get_call_chain()
+                test_chain = self._get_call_chain_tracker().get_call_chain()
                 print(f"初始化时调用链: {test_chain}")
             except Exception as e:
                 print(f"调用链追踪器测试失败: {e}")
@@ -236,17 +248,21 @@ class ConfigManagerCore(ConfigNode):
         # 生成所有路径并自动创建目录
         self._path_config_manager.setup_project_paths()
 
+    def _get_call_chain_tracker(self) -> CallChainTracker:
+        """获取调用链追踪器"""
+        return self._call_chain_tracker
+
     def _load(self):
         """加载配置文件"""
         from ..config_manager import ENABLE_CALL_CHAIN_DISPLAY
 
         if ENABLE_CALL_CHAIN_DISPLAY:
-            logger.debug(f"=== 开始加载配置文件: {self._config_path} ===")
+            logger.debug("=== 开始加载配置文件: %s ===", self._config_path)
 
         # 根据开关决定是否显示调用链
         if ENABLE_CALL_CHAIN_DISPLAY:
             try:
-                load_call_chain = self._call_chain_tracker.get_call_chain()
+                load_call_chain = self._get_call_chain_tracker().get_call_chain()
                 print(f"加载配置时的调用链: {load_call_chain}")
             except Exception as e:
                 print(f"获取加载调用链失败: {e}")
@@ -254,7 +270,7 @@ class ConfigManagerCore(ConfigNode):
         loaded = self._file_ops.load_config(
             self._config_path,
             self._auto_create,
-            self._call_chain_tracker
+            self._get_call_chain_tracker() if ENABLE_CALL_CHAIN_DISPLAY else None
         )
 
         # 修复：None表示加载失败，空字典{}表示成功加载空配置
@@ -264,47 +280,54 @@ class ConfigManagerCore(ConfigNode):
             # 检查是否为标准格式（包含__data__节点）
             if '__data__' in loaded:
                 # 标准格式：合并__data__节点和顶层别名引用键
-                raw_data = loaded.get('__data__', {}).copy()
-                self._type_hints = loaded.get('__type_hints__', {})
+                data_section = loaded.get('__data__') or {}
+                # 加载结果可能与解析缓存共享，类型提示会被修改，需要复制
+                type_hints = loaded.get('__type_hints__')
+                # 多数配置的类型注释为空（或为null），直接使用新的空字典，不做复制
+                if not type_hints:
+                    self._type_hints = {}
+                else:
+                    self._type_hints = type_hints.copy() if isinstance(type_hints, dict) else type_hints
                 
                 # 添加顶层的别名引用键（非系统键），但__data__中的值具有更高优先级
-                for key, value in loaded.items():
-                    if not key.startswith('__') and key not in raw_data:
-                        raw_data[key] = value
+                # 直接串联迭代，不复制整个__data__节点
+                raw_items = itertools.chain(
+                    data_section.items(),
+                    ((key, value) for key, value in loaded.items()
+                     if not key.startswith('__') and key not in data_section)
+                )
                 
                 if ENABLE_CALL_CHAIN_DISPLAY:
                     logger.debug("检测到标准格式，加载__data__节点和顶层别名引用")
             else:
-                # 原始格式：直接使用整个loaded数据，但排除内部键
-                raw_data = {}
-                for key, value in loaded.items():
-                    # 排除ConfigManager的内部键
-                    if not key.startswith('__'):
-                        raw_data[key] = value
+                # 原始格式：直接使用整个loaded数据，但排除ConfigManager的内部键
+                raw_items = ((key, value) for key, value in loaded.items() if not key.startswith('__'))
                 self._type_hints = {}
                 if ENABLE_CALL_CHAIN_DISPLAY:
                     logger.debug("检测到原始格式，直接加载配置数据")
 
             # 重建数据结构（过滤系统键，防止污染）
-            if raw_data:
-                # 定义需要过滤的系统键
-                system_keys = {'__type_hints__', '__data__', 'debug_mode'}
-                
-                for key, value in raw_data.items():
-                    # 过滤系统键，防止从污染文件加载时污染内存数据结构
-                    if key in system_keys:
-                        if ENABLE_CALL_CHAIN_DISPLAY:
-                            logger.debug(f"过滤加载时的系统键污染: {key}")
-                        continue
-                        
-                    if isinstance(value, dict):
-                        # 递归转换字典中的字符串化数据
-                        converted_dict = self._convert_stringified_data_recursive(value)
-                        self._data[key] = ConfigNode(converted_dict)
-                    else:
-                        # 检查并转换字符串化的列表
-                        converted_value = self._convert_stringified_data(value)
-                        self._data[key] = converted_value
+            # 定义需要过滤的系统键
+            system_keys = {'__type_hints__', '__data__', 'debug_mode'}
+
+            for key, value in raw_items:
+                # 过滤系统键，防止从污染文件加载时污染内存数据结构
+                if key in system_keys:
+                    if ENABLE_CALL_CHAIN_DISPLAY:
+                        logger.debug("过滤加载时的系统键污染: %s", key)
+                    continue
+
+                key = _intern_key(key)
+                if isinstance(value, dict):
+                    # 转换字典中的字符串化数据并构建配置节点
+                    self._data[key] = self._build_config_node(value)
+                elif isinstance(value, list):
+                    # 列表可能与解析缓存共享，复制后再存入
+                    self._data[key] = copy.deepcopy(value)
+                else:
+                    # 检查并转换字符串化的列表
+                    converted_value = self._convert_stringified_data(value)
+                    self._data[key] = converted_value
 
             if ENABLE_CALL_CHAIN_DISPLAY:
                 logger.debug("配置加载完成")
@@ -342,7 +365,7 @@ class ConfigManagerCore(ConfigNode):
             # 根据开关决定是否显示保存时的调用链
             if ENABLE_CALL_CHAIN_DISPLAY:
                 try:
-                    save_call_chain = self._call_chain_tracker.get_call_chain()
+                    save_call_chain = self._get_call_chain_tracker().get_call_chain()
                     print(f"保存配置时的调用链: {save_call_chain}")
                 except Exception as e:
                     print(f"获取保存调用链失败: {e}")
@@ -378,7 +401,7 @@ class ConfigManagerCore(ConfigNode):
                 self._last_backup_path = backup_path
 
             if ENABLE_CALL_CHAIN_DISPLAY:
-                logger.debug(f"保存结果: {saved}")
+                logger.debug("保存结果: %s", saved)
             return saved
         finally:
             self._saving = False
@@ -432,7 +455,7 @@ class ConfigManagerCore(ConfigNode):
         # 这样避免竞态条件导致的递归保存问题
         
         if ENABLE_CALL_CHAIN_DISPLAY:
-            logger.debug(f"静默保存结果: {saved}")
+            logger.debug("静默保存结果: %s", saved)
         return saved
 
     def reload(self):
@@ -445,14 +468,14 @@ class ConfigManagerCore(ConfigNode):
         # 根据开关决定是否显示重新加载时的调用链
         if ENABLE_CALL_CHAIN_DISPLAY:
             try:
-                reload_call_chain = self._call_chain_tracker.get_call_chain()
+                reload_call_chain = self._get_call_chain_tracker().get_call_chain()
                 print(f"重新加载配置时的调用链: {reload_call_chain}")
             except Exception as e:
                 print(f"获取重新加载调用链失败: {e}")
 
         reloaded = self._load()
         if ENABLE_CALL_CHAIN_DISPLAY:
-            logger.debug(f"重新加载结果: {reloaded}")
+            logger.debug("重新加载结果: %s", reloaded)
         return reloaded
 
     def get_last_backup_path(self) -> str:
@@ -522,7 +545,7 @@ class ConfigManagerCore(ConfigNode):
             
             if backup_success:
                 self._last_backup_path = backup_path
-                logger.info(f"初始化备份已创建: {backup_path}")
+                logger.info("初始化备份已创建: %s", backup_path)
             else:
                 logger.warning("初始化备份创建失败")
                 
@@ -535,16 +558,7 @@ class ConfigManagerCore(ConfigNode):
     def _create_backup_file(self, backup_path: str, data: dict) -> bool:
         """创建备份文件，不输出额外信息"""
         try:
-            import os
-            backup_dir = os.path.dirname(backup_path)
-            if backup_dir:
-                os.makedirs(backup_dir, exist_ok=True)
-
-            tmp_backup_path = f"{backup_path}.tmp"
-            with open(tmp_backup_path, 'w', encoding='utf-8') as f:
-                self._file_ops._yaml.dump(data, f)
-
-            os.replace(tmp_backup_path, backup_path)
+            self._file_ops._write_backup_text(backup_path, self._file_ops._dump_to_text(data))
             return True
         except Exception as e:
             logger.warning(f"备份文件创建失败: {str(e)}")
@@ -553,10 +567,10 @@ class ConfigManagerCore(ConfigNode):
     def _can_safely_serialize(self) -> bool:
         """检查配置数据是否可以安全序列化"""
         try:
-            # 尝试序列化to_dict()的结果
+            # 尝试序列化to_dict()的结果，优先使用libyaml的C实现
             import yaml
             test_data = self.to_dict()
-            yaml.safe_dump(test_data)
+            yaml.dump(test_data, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
             return True
         except Exception:
             return False
@@ -608,7 +622,7 @@ class ConfigManagerCore(ConfigNode):
                 import ast
                 parsed = ast.literal_eval(stripped)
                 if isinstance(parsed, list):
-                    logger.debug(f"检测到字符串化列表并转换: {stripped[:50]}...")
+                    logger.debug("检测到字符串化列表并转换: %s...", stripped[:50])
                     return parsed
             except (ValueError, SyntaxError):
                 # 解析失败，保持原字符串
@@ -620,7 +634,7 @@ class ConfigManagerCore(ConfigNode):
                 import ast
                 parsed = ast.literal_eval(stripped)
                 if isinstance(parsed, dict):
-                    logger.debug(f"检测到字符串化字典并转换: {stripped[:50]}...")
+                    logger.debug("检测到字符串化字典并转换: %s...", stripped[:50])
                     return parsed
             except (ValueError, SyntaxError):
                 pass
@@ -628,29 +642,41 @@ class ConfigManagerCore(ConfigNode):
         # 其他情况返回原值
         return value
 
-    def _convert_stringified_data_recursive(self, data):
-        """递归转换嵌套数据结构中的字符串化数据（过滤系统键）"""
-        if isinstance(data, dict):
-            result = {}
-            # 定义需要过滤的系统键
-            system_keys = {'__type_hints__', '__data__', 'debug_mode'}
-            
-            for key, value in data.items():
-                # 过滤系统键，防止嵌套污染
-                if key in system_keys:
-                    continue
-                    
+    def _build_config_node(self, data: dict) -> ConfigNode:
+        """将嵌套字典一次性构建为ConfigNode树，同时转换字符串化数据（过滤系统键）
+
+        使用显式栈迭代遍历，不受递归深度限制，也不再先生成中间字典再交给
+        ConfigNode逐层build。
+        """
+        # 定义需要过滤的系统键
+        system_keys = {'__type_hints__', '__data__', 'debug_mode'}
+
+        root = ConfigNode()
+        # 栈中保存 (源容器, 目标容器)，目标为ConfigNode的_data字典或列表
+        stack = [(data, root._data)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                # 过滤系统键，防止嵌套污染；键名驻留后在各实例间共享
+                items = ((_intern_key(key), value) for key, value in source.items() if key not in system_keys)
+            else:
+                items = enumerate(source)
+
+            for key, value in items:
                 if isinstance(value, dict):
-                    result[key] = self._convert_stringified_data_recursive(value)
+                    child = ConfigNode()
+                    stack.append((value, child._data))
                 elif isinstance(value, list):
-                    result[key] = [self._convert_stringified_data_recursive(item) for item in value]
+                    child = []
+                    stack.append((value, child))
                 else:
-                    result[key] = self._convert_stringified_data(value)
-            return result
-        elif isinstance(data, list):
-            return [self._convert_stringified_data_recursive(item) for item in data]
-        else:
-            return self._convert_stringified_data(data)
+                    child = ConfigNode.build(self._convert_stringified_data(value))
+
+                if isinstance(target, dict):
+                    target[key] = child
+                else:
+                    target.append(child)
+        return root
 
     def _on_file_changed(self):
         """文件变化回调"""
@@ -661,7 +687,7 @@ class ConfigManagerCore(ConfigNode):
         # 根据开关决定是否显示文件变化时的调用链
         if ENABLE_CALL_CHAIN_DISPLAY:
             try:
-                change_call_chain = self._call_chain_tracker.get_call_chain()
+                change_call_chain = self._get_call_chain_tracker().get_call_chain()
                 print(f"文件变化回调的调用链: {change_call_chain}")
             except Exception as e:
                 print(f"获取文件变化调用链失败: {e}")
@@ -717,7 +743,7 @@ class ConfigManagerCore(ConfigNode):
             # 根据开关决定是否显示自动保存调度时的调用链
             if ENABLE_CALL_CHAIN_DISPLAY:
                 try:
-                    autosave_call_chain = self._call_chain_tracker.get_call_chain()
+                    autosave_call_chain = self._get_call_chain_tracker().get_call_chain()
                     action = "标记需要保存" if getattr(self, '_during_initialization', False) else "安排自动保存"
                     print(f"{action}时的调用链: {autosave_call_chain}")
                 except Exception as e:
@@ -798,18 +824,16 @@ class ConfigManagerCore(ConfigNode):
                 # 创建测试目录（跨平台）
                 os.makedirs(self._base_dir, exist_ok=True)
                 
-                logger.debug(f"测试模式路径: {self._base_dir}")
+                logger.debug("测试模式路径: %s", self._base_dir)
             else:
                 # 生产模式：从多平台配置选择当前平台
                 # 直接访问_data字典避免触发__getattr__循环
                 base_dir_config = self._data.get('base_dir')
-                if isinstance(base_dir_config, dict) or hasattr(base_dir_config, 'to_dict'):
-                    # 如果是 ConfigNode，转换为普通字典
-                    if hasattr(base_dir_config, 'to_dict'):
-                        config_dict = base_dir_config.to_dict()
-                    else:
-                        config_dict = base_dir_config
-                    platform_path = get_platform_path(config_dict, 'base_dir')
+                if hasattr(base_dir_config, 'to_dict'):
+                    # ConfigNode只做只读查找，直接使用其内部字典，避免每次get('base_dir')都复制一份
+                    base_dir_config = base_dir_config._data
+                if isinstance(base_dir_config, dict):
+                    platform_path = get_platform_path(base_dir_config, 'base_dir')
                     current_platform = self._get_current_platform()
                     
                     # 如果当前平台路径为空，使用默认值
@@ -984,7 +1008,7 @@ class ConfigManagerCore(ConfigNode):
                     
                     value = ConfigNode(config_dict, _root=self)
                 except Exception as e:
-                    logger.debug(f"创建多平台base_dir配置失败: {e}, 将其保留为字符串。")
+                    logger.debug("创建多平台base_dir配置失败: %s, 将其保留为字符串。", e)
 
         keys = key.split('.')
         current = self
@@ -1030,19 +1054,23 @@ class ConfigManagerCore(ConfigNode):
         path_obj = Path(path_str)
         return path_obj
 
-    def update(self, *args, **kwargs):
-        """批量更新配置值"""
-        if args and isinstance(args[0], dict):
-            updates = args[0]
-            autosave = kwargs.get('autosave', True)
-        else:
-            updates = dict(*args, **kwargs)
-            autosave = True
+    def update(self, *args, save: bool = False, autosave: bool = True, **kwargs):
+        """批量更新配置值，参数形式与dict.update相同
+
+        Args:
+            save: 全部写入后立即保存一次（此时不再安排自动保存）
+            autosave: 是否安排自动保存
+
+        save和autosave只能以关键字传入，不会被当作配置键写入。
+        """
+        updates = dict(*args, **kwargs)
 
         for key, value in updates.items():
             self.set(key, value, autosave=False)
 
-        if autosave:
+        if save:
+            self.save()
+        elif autosave:
             self._schedule_autosave()
         return
 
@@ -1259,9 +1287,8 @@ class ConfigManagerCore(ConfigNode):
             return True
 
         # 检查字段名是否包含路径关键词
-        path_keywords = ['dir', 'path', 'directory', 'folder', 'location', 'root', 'base']
         key_lower = key.lower()
-        if any(keyword in key_lower for keyword in path_keywords):
+        if any(keyword in key_lower for keyword in _PATH_KEY_KEYWORDS):
             # 进一步检查值是否像路径
             return self._looks_like_path(value)
 
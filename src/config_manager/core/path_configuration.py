@@ -13,6 +13,25 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 派生目录的路径模板，键顺序即写入配置的顺序
+_DERIVED_PATH_TEMPLATES = {
+    "checkpoint_dir": os.path.join("{work}", "checkpoint"),
+    "best_checkpoint_dir": os.path.join("{work}", "checkpoint", "best"),
+    "debug_dir": os.path.join("{work}", "debug", "{date}", "{time}"),
+    "log_dir": os.path.join("{work}", "logs", "{date}", "{time}"),
+    "backup_dir": os.path.join("{work}", "backup", "{date}", "{time}"),
+    "cache_dir": os.path.join("{work}", "cache"),
+}
+
+
+def _format_path_templates(
+    names: Tuple[str, ...], work_dir: str, date_str: str = "", time_str: str = ""
+) -> Dict[str, str]:
+    """用同一个上下文一次性填充多个路径模板"""
+    # 与Path(work_dir)的规范化保持一致（去掉末尾分隔符、重复分隔符等）
+    context = {"work": str(Path(work_dir)), "date": date_str, "time": time_str}
+    return {name: _DERIVED_PATH_TEMPLATES[name].format_map(context) for name in names}
+
 
 class PathConfigurationError(Exception):
     """路径配置错误基类"""
@@ -183,8 +202,8 @@ class PathGenerator:
         else:
             base_path = str(base_dir)
 
-        # 标准化基础路径
-        base_path = os.path.normpath(base_path)
+        # 展开~并标准化基础路径，避免在当前目录下生成名为~的目录
+        base_path = os.path.normpath(os.path.expanduser(base_path))
 
         # 组合路径
         if debug_mode:
@@ -203,11 +222,11 @@ class PathGenerator:
         Returns:
             dict: 检查点目录路径字典
         """
-        work_path = Path(work_dir)
+        paths = _format_path_templates(("checkpoint_dir", "best_checkpoint_dir"), work_dir)
 
         checkpoint_dirs = {
-            "paths.checkpoint_dir": str(work_path / "checkpoint"),
-            "paths.best_checkpoint_dir": str(work_path / "checkpoint" / "best"),
+            "paths.checkpoint_dir": paths["checkpoint_dir"],
+            "paths.best_checkpoint_dir": paths["best_checkpoint_dir"],
         }
 
         return checkpoint_dirs
@@ -265,11 +284,11 @@ class PathGenerator:
         Returns:
             dict: 日志目录路径字典
         """
-        work_path = Path(work_dir)
+        paths = _format_path_templates(("log_dir",), work_dir, date_str, time_str)
 
         # 注意：tsb_logs_dir现在是动态生成的，不在这里生成
         log_dirs = {
-            "paths.log_dir": str(work_path / "logs" / date_str / time_str),
+            "paths.log_dir": paths["log_dir"],
         }
 
         return log_dirs
@@ -287,9 +306,9 @@ class PathGenerator:
         Returns:
             dict: 调试目录路径字典
         """
-        work_path = Path(work_dir)
+        paths = _format_path_templates(("debug_dir",), work_dir, date_str, time_str)
 
-        debug_dirs = {"paths.debug_dir": str(work_path / "debug" / date_str / time_str)}
+        debug_dirs = {"paths.debug_dir": paths["debug_dir"]}
 
         return debug_dirs
 
@@ -327,10 +346,10 @@ class PathGenerator:
         Returns:
             dict: 备份目录路径字典
         """
-        work_path = Path(work_dir)
+        paths = _format_path_templates(("backup_dir",), work_dir, date_str, time_str)
 
         backup_dirs = {
-            "paths.backup_dir": str(work_path / "backup" / date_str / time_str)
+            "paths.backup_dir": paths["backup_dir"]
         }
 
         return backup_dirs
@@ -344,12 +363,29 @@ class PathGenerator:
         Returns:
             dict: 缓存目录路径字典
         """
-        work_path = Path(work_dir)
+        paths = _format_path_templates(("cache_dir",), work_dir)
 
-        cache_dirs = {"paths.cache_dir": str(work_path / "cache")}
+        cache_dirs = {"paths.cache_dir": paths["cache_dir"]}
 
         return cache_dirs
 
+    def generate_derived_directories(
+        self, work_dir: str, date_str: str, time_str: str
+    ) -> Dict[str, str]:
+        """一次生成工作目录下的所有派生目录路径
+
+        Args:
+            work_dir: 工作目录
+            date_str: 日期字符串（YYYYMMDD）
+            time_str: 时间字符串（HHMMSS）
+
+        Returns:
+            dict: 不带"paths."前缀的派生目录路径字典
+        """
+        return _format_path_templates(
+            tuple(_DERIVED_PATH_TEMPLATES), work_dir, date_str, time_str
+        )
+
 
 class PathValidator:
     """路径验证器"""
@@ -720,9 +756,6 @@ class PathConfigurationManager:
             base_dir, project_name, experiment_name, debug_mode
         )
 
-        # 生成检查点目录
-        checkpoint_dirs = self._path_generator.generate_checkpoint_directories(work_dir)
-
         # 解析时间组件
         if first_start_time:
             try:
@@ -738,32 +771,12 @@ class PathConfigurationManager:
 
         # TensorBoard目录现在是动态生成的，不需要在这里生成
 
-        # 生成调试目录（需要在时间组件解析之后）
-        debug_dirs = self._path_generator.generate_debug_directory(
-            work_dir, date_str, time_str
-        )
-
-        # 生成日志目录
-        log_dirs = self._path_generator.generate_log_directories(
-            work_dir, date_str, time_str
-        )
-
-        # 生成备份目录
-        backup_dirs = self._path_generator.generate_backup_directory(
-            work_dir, date_str, time_str
-        )
-
-        # 生成缓存目录
-        cache_dirs = self._path_generator.generate_cache_directory(work_dir)
-
-        # 合并所有路径配置（移除tensorboard_dirs，因为它现在是动态的）
+        # 检查点、调试、日志、备份、缓存目录共用一个模板上下文一次生成
         path_configs = {
             "work_dir": work_dir,
-            **{k.replace("paths.", ""): v for k, v in checkpoint_dirs.items()},
-            **{k.replace("paths.", ""): v for k, v in debug_dirs.items()},
-            **{k.replace("paths.", ""): v for k, v in log_dirs.items()},
-            **{k.replace("paths.", ""): v for k, v in backup_dirs.items()},
-            **{k.replace("paths.", ""): v for k, v in cache_dirs.items()},
+            **self._path_generator.generate_derived_directories(
+                work_dir, date_str, time_str
+            ),
         }
 
         return {"paths": path_configs}
@@ -5,7 +5,11 @@ from datetime import datetime
 start_time = datetime.now()
 
 import os
-import inspect
+import re
+import sys
+
+# 调用栈扫描时需要跳过的标准库和调试器文件（忽略大小写，模块加载时编译一次）
+_SKIP_FRAME_RE = re.compile(r'lib/python|pydev', re.IGNORECASE)
 
 
 class PathResolver:
@@ -131,19 +135,24 @@ class PathResolver:
     def _find_main_file_from_stack() -> str | None:
         """从调用栈中找到主程序文件"""
         try:
-            for frame_info in reversed(inspect.stack()):  # 从栈底开始查找
-                filename = frame_info.filename
+            # 直接遍历帧对象，避免inspect.stack()读取源码行的开销
+            frames = []
+            frame = sys._getframe(0)
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+
+            for frame in reversed(frames):  # 从栈底开始查找
+                filename = frame.f_code.co_filename
 
                 # 跳过系统文件和调试器文件
                 if (('site-packages' in filename) or
-                        ('lib/python' in filename.lower()) or
-                        ('pydev' in filename.lower()) or
-                        ('_pydev_' in filename.lower()) or
+                        _SKIP_FRAME_RE.search(filename) or
                         ('<' in filename and '>' in filename)):  # 跳过 <stdin>, <string> 等
                     continue
 
                 # 找到可能的主程序文件
-                if filename.endswith('main.py') or '__main__' in frame_info.frame.f_globals.get('__name__', ''):
+                if filename.endswith('main.py') or '__main__' in frame.f_globals.get('__name__', ''):
                     return filename
 
         except Exception:
@@ -154,17 +163,16 @@ class PathResolver:
     def _find_project_root_from_stack() -> str | None:
         """从调用栈查找项目根目录"""
         try:
-            for frame_info in inspect.stack():
-                filename = frame_info.filename
-                module_name = frame_info.frame.f_globals.get('__name__', '')
+            frame = sys._getframe(0)
+            while frame is not None:
+                filename = frame.f_code.co_filename
+                module_name = frame.f_globals.get('__name__', '')
+                frame = frame.f_back
 
                 # 跳过系统模块和调试器模块
-                if (module_name.startswith('config_manager') or
-                        module_name.startswith('src.config_manager') or
+                if (module_name.startswith(('config_manager', 'src.config_manager')) or
                         'site-packages' in filename or
-                        'lib/python' in filename.lower() or
-                        'pydev' in filename.lower() or
-                        '_pydev_' in filename.lower() or
+                        _SKIP_FRAME_RE.search(filename) or
                         module_name in ['inspect', 'threading', '__main__']):
                     continue
 
@@ -198,7 +206,7 @@ class PathResolver:
 
             # 检查当前目录是否包含src子目录
             src_path = os.path.join(current_path, 'src')
-            if os.path.exists(src_path) and os.path.isdir(src_path):
+            if os.path.isdir(src_path):
                 # 找到src目录，检查是否是有效的项目根目录
                 if PathResolver._is_valid_project_root(current_path):
                     return current_path
@@ -267,7 +275,8 @@ class PathResolver:
     @staticmethod
     def _src_has_python_code(src_path: str) -> bool:
         """检查src目录下是否有Python代码"""
-        if not os.path.exists(src_path) or not os.path.isdir(src_path):
+        # isdir对不存在的路径同样返回False，只需一次stat
+        if not os.path.isdir(src_path):
             return False
 
         try:
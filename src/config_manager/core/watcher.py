@@ -17,6 +17,7 @@ class FileWatcher:
         self._watcher_thread = None
         self._stop_watcher = threading.Event()
         self._last_mtime = 0
+        self._last_signature = None  # (st_mtime_ns, st_size)，文件不存在时为None
         self._config_path = None
         self._callback = None
         self._internal_save_flag = False  # 内部保存标志
@@ -31,9 +32,10 @@ class FileWatcher:
         self._callback = callback
         self._stop_watcher.clear()
 
-        # 记录初始修改时间
-        if os.path.exists(config_path):
-            self._last_mtime = os.path.getmtime(config_path)
+        # 记录初始修改时间和大小
+        self._last_signature = self._stat_signature(config_path)
+        if self._last_signature is not None:
+            self._last_mtime = self._last_signature[0] / 1e9
 
         self._watcher_thread = threading.Thread(
             target=self._watch_file,
@@ -61,43 +63,66 @@ class FileWatcher:
             self._internal_save_start_time = time.time()
         return
 
+    @staticmethod
+    def _stat_signature(path: str) -> tuple[int, int] | None:
+        """一次stat同时取得修改时间(纳秒)和大小，文件不存在时返回None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _record_signature(self, signature: tuple[int, int]):
+        """记录已处理的文件状态"""
+        self._last_signature = signature
+        self._last_mtime = signature[0] / 1e9
+        return
+
+    def _check_for_change(self):
+        """检查一次配置文件，发生外部变化时触发回调并记录新的文件状态"""
+        # 检查内部保存标志是否需要超时重置（5秒后自动重置）
+        if self._internal_save_flag and time.time() - self._internal_save_start_time > 5:
+            self._internal_save_flag = False
+            print("⚠️  内部保存标志超时重置")
+
+        # 每轮只stat一次，修改时间或大小任一变化都视为文件变化，
+        # 同一时间戳内的快速写入也能通过大小变化被发现
+        signature = self._stat_signature(self._config_path)
+        if signature is None or signature == self._last_signature:
+            return
+
+        # 检查是否是内部保存
+        if self._internal_save_flag:
+            # 检查时间窗口：如果修改时间距离标志设置时间过长（超过2秒），认为是外部修改
+            time_since_flag_set = time.time() - self._internal_save_start_time
+            if time_since_flag_set > 2.0:
+                # 时间窗口过长，认为是外部修改，重置标志并触发重新加载
+                print(f"📁 检测到延迟外部文件变化（{time_since_flag_set:.1f}s），触发重新加载")
+                self._internal_save_flag = False
+                self._callback()
+                self._record_signature(signature)
+            else:
+                # 是内部保存，只更新修改时间，不触发回调
+                self._record_signature(signature)
+                print(f"🔒 跳过内部保存触发的文件变化检测")
+                # 检测到内部保存后立即重置标志
+                self._internal_save_flag = False
+        else:
+            # 是外部变化，触发回调重新加载
+            print(f"📁 检测到外部文件变化，触发重新加载")
+            self._callback()
+            self._record_signature(signature)
+        return
+
     def _watch_file(self):
         """监视配置文件变化"""
         while not self._stop_watcher.is_set():
             try:
-                # 检查内部保存标志是否需要超时重置（5秒后自动重置）
-                if self._internal_save_flag and time.time() - self._internal_save_start_time > 5:
-                    self._internal_save_flag = False
-                    print("⚠️  内部保存标志超时重置")
-                
-                if os.path.exists(self._config_path):
-                    current_mtime = os.path.getmtime(self._config_path)
-                    if current_mtime > self._last_mtime:
-                        # 检查是否是内部保存
-                        if self._internal_save_flag:
-                            # 检查时间窗口：如果修改时间距离标志设置时间过长（超过2秒），认为是外部修改
-                            time_since_flag_set = time.time() - self._internal_save_start_time
-                            if time_since_flag_set > 2.0:
-                                # 时间窗口过长，认为是外部修改，重置标志并触发重新加载
-                                print(f"📁 检测到延迟外部文件变化（{time_since_flag_set:.1f}s），触发重新加载")
-                                self._internal_save_flag = False
-                                self._callback()
-                                self._last_mtime = current_mtime
-                            else:
-                                # 是内部保存，只更新修改时间，不触发回调
-                                self._last_mtime = current_mtime
-                                print(f"🔒 跳过内部保存触发的文件变化检测")
-                                # 检测到内部保存后立即重置标志
-                                self._internal_save_flag = False
-                        else:
-                            # 是外部变化，触发回调重新加载
-                            print(f"📁 检测到外部文件变化，触发重新加载")
-                            self._callback()
-                            self._last_mtime = current_mtime
+                self._check_for_change()
                 # 使用可中断的等待，立即响应停止信号
                 self._stop_watcher.wait(timeout=1.0)
             except Exception as e:
                 print(f"监视配置出错: {str(e)}")
                 # 异常情况下也使用可中断等待，而不是阻塞睡眠
                 self._stop_watcher.wait(timeout=2.0)
-        return
\ No newline at end of file
+        return
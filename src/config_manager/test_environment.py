@@ -24,26 +24,27 @@ class TestEnvironmentManager:
         temp_base = tempfile.gettempdir()
         tests_dir = os.path.join(temp_base, 'tests')
 
-        if not os.path.exists(tests_dir):
-            return 0
-
         cutoff_time = datetime.now() - timedelta(days=days_old)
         cleaned_count = 0
 
         try:
-            for date_dir in os.listdir(tests_dir):
-                date_path = os.path.join(tests_dir, date_dir)
-                if os.path.isdir(date_path):
-                    try:
-                        # 解析日期
-                        dir_date = datetime.strptime(date_dir, '%Y%m%d')
-                        if dir_date < cutoff_time:
-                            shutil.rmtree(date_path)
-                            print(f"✓ 已清理旧测试环境: {date_path}")
-                            cleaned_count += 1
-                    except (ValueError, OSError) as e:
-                        print(f"⚠️  清理测试环境失败 {date_path}: {e}")
-                        continue
+            for date_entry in TestEnvironmentManager._scan_dirs(tests_dir):
+                date_path = date_entry.path
+                try:
+                    # 解析日期
+                    dir_date = datetime.strptime(date_entry.name, '%Y%m%d')
+                    if dir_date < cutoff_time:
+                        shutil.rmtree(date_path)
+                        print(f"✓ 已清理旧测试环境: {date_path}")
+                        cleaned_count += 1
+                except FileNotFoundError:
+                    # 已被其他进程清理
+                    continue
+                except (ValueError, OSError) as e:
+                    print(f"⚠️  清理测试环境失败 {date_path}: {e}")
+                    continue
+        except FileNotFoundError:
+            return 0
         except OSError as e:
             print(f"⚠️  访问测试目录失败 {tests_dir}: {e}")
 
@@ -66,16 +67,15 @@ class TestEnvironmentManager:
 
         # 检查测试目录是否存在
         if info['tests_dir']:
-            info['tests_dir_exists'] = os.path.exists(info['tests_dir'])
-            if info['tests_dir_exists']:
-                try:
-                    info['test_environments_count'] = len([
-                        d for d in os.listdir(info['tests_dir'])
-                        if os.path.isdir(os.path.join(info['tests_dir'], d))
-                    ])
-                except OSError:
-                    info['test_environments_count'] = 0
-            else:
+            info['tests_dir_exists'] = True
+            try:
+                info['test_environments_count'] = sum(
+                    1 for _ in TestEnvironmentManager._scan_dirs(info['tests_dir'])
+                )
+            except FileNotFoundError:
+                info['tests_dir_exists'] = False
+                info['test_environments_count'] = 0
+            except OSError:
                 info['test_environments_count'] = 0
 
         return info
@@ -113,37 +113,31 @@ class TestEnvironmentManager:
         tests_dir = os.path.join(temp_base, 'tests')
         environments = []
 
-        if not os.path.exists(tests_dir):
-            return environments
-
         try:
-            for date_dir in os.listdir(tests_dir):
-                date_path = os.path.join(tests_dir, date_dir)
-                if os.path.isdir(date_path):
-                    try:
-                        # 解析日期
-                        dir_date = datetime.strptime(date_dir, '%Y%m%d')
-
-                        # 统计时间目录
-                        time_dirs = []
-                        for time_dir in os.listdir(date_path):
-                            time_path = os.path.join(date_path, time_dir)
-                            if os.path.isdir(time_path):
-                                time_dirs.append({
-                                    'time': time_dir,
-                                    'path': time_path,
-                                    'size': TestEnvironmentManager._get_dir_size(time_path)
-                                })
-
-                        environments.append({
-                            'date': date_dir,
-                            'date_parsed': dir_date,
-                            'path': date_path,
-                            'time_environments': time_dirs,
-                            'total_size': sum(env['size'] for env in time_dirs)
-                        })
-                    except (ValueError, OSError):
-                        continue
+            for date_entry in TestEnvironmentManager._scan_dirs(tests_dir):
+                try:
+                    # 解析日期
+                    dir_date = datetime.strptime(date_entry.name, '%Y%m%d')
+
+                    # 统计时间目录
+                    time_dirs = [
+                        {
+                            'time': time_entry.name,
+                            'path': time_entry.path,
+                            'size': TestEnvironmentManager._get_dir_size(time_entry.path)
+                        }
+                        for time_entry in TestEnvironmentManager._scan_dirs(date_entry.path)
+                    ]
+
+                    environments.append({
+                        'date': date_entry.name,
+                        'date_parsed': dir_date,
+                        'path': date_entry.path,
+                        'time_environments': time_dirs,
+                        'total_size': sum(env['size'] for env in time_dirs)
+                    })
+                except (ValueError, OSError):
+                    continue
         except OSError:
             pass
 
@@ -151,20 +145,31 @@ class TestEnvironmentManager:
         environments.sort(key=lambda x: x['date_parsed'], reverse=True)
         return environments
 
+    @staticmethod
+    def _scan_dirs(path: str) -> list[os.DirEntry]:
+        """列出目录下的子目录，利用scandir缓存的类型信息避免逐项stat"""
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+
     @staticmethod
     def _get_dir_size(path: str) -> int:
         """获取目录大小（字节）"""
         total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except OSError:
-                        continue
-        except OSError:
-            pass
+        pending = [path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            # 与os.walk一致，不进入符号链接指向的目录
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                total_size += entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         return total_size
 
     @staticmethod
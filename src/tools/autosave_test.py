@@ -15,6 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config_manager.config_manager import get_config_manager, _clear_instances_for_testing
 
+# 优先使用libyaml的C加载器，未安装时回退到纯Python实现
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def autosave_test():
     """测试自动保存功能"""
@@ -57,7 +60,7 @@ def autosave_test():
 
                 # 解析内容
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    parsed_content = yaml.safe_load(f)
+                    parsed_content = yaml.load(f, Loader=YamlLoader)
                     print(f"✓ 解析后内容: {parsed_content}")
 
                     data_section = parsed_content.get('__data__', {})
@@ -16,6 +16,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config_manager.config_manager import get_config_manager, _clear_instances_for_testing
 
+# 优先使用libyaml的C加载器，未安装时回退到纯Python实现
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def debug_autosave_detailed():
     """详细调试自动保存问题"""
@@ -55,7 +58,7 @@ def debug_autosave_detailed():
 
             if os.path.exists(config_file):
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    manual_content = yaml.safe_load(f)
+                    manual_content = yaml.load(f, Loader=YamlLoader)
                 print(f"手动保存内容: {manual_content}")
 
             # 删除文件，重新测试自动保存
@@ -85,7 +88,7 @@ def debug_autosave_detailed():
 
             if file_exists:
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    auto_content = yaml.safe_load(f)
+                    auto_content = yaml.load(f, Loader=YamlLoader)
                 print(f"自动保存内容: {auto_content}")
 
             # 测试线程安全
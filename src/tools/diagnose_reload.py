@@ -14,6 +14,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config_manager.config_manager import get_config_manager, _clear_instances_for_testing
 
+# 优先使用libyaml的C加载器，未安装时回退到纯Python实现
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def diagnose_reload_issue():
     """诊断重新加载问题"""
@@ -53,7 +56,7 @@ def diagnose_reload_issue():
             # 检查保存的文件内容
             if os.path.exists(config_file):
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    saved_content = yaml.safe_load(f)
+                    saved_content = yaml.load(f, Loader=YamlLoader)
                 print(f"✓ 保存的文件内容: {saved_content}")
             else:
                 print("❌ 配置文件不存在")
@@ -14,6 +14,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config_manager.config_manager import get_config_manager, _clear_instances_for_testing
 
+# 优先使用libyaml的C加载器，未安装时回退到纯Python实现
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def simple_save_load_test():
     """简单的保存加载测试"""
@@ -53,7 +56,7 @@ def simple_save_load_test():
 
                 # 解析YAML
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    parsed_content = yaml.safe_load(f)
+                    parsed_content = yaml.load(f, Loader=YamlLoader)
                     print(f"✓ 解析后内容: {parsed_content}")
             else:
                 print("❌ 文件不存在")
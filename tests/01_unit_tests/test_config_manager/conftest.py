@@ -0,0 +1,21 @@
+# tests/01_unit_tests/test_config_manager/conftest.py
+from __future__ import annotations
+from datetime import datetime
+import pytest
+
+start_time = datetime.now()
+
+
+@pytest.fixture
+def clear_instances_fixture():
+    """在测试前后清理src.config_manager的ConfigManager单例
+
+    通过 pytestmark = pytest.mark.usefixtures("clear_instances_fixture") 按模块启用。
+    """
+    from src.config_manager.config_manager import ConfigManager, _clear_instances_for_testing
+
+    # 上一个测试结束时已清理过，注册表为空时跳过前置清理及其中的gc.collect()
+    if ConfigManager._production_instances or ConfigManager._instances:
+        _clear_instances_for_testing()
+    yield
+    _clear_instances_for_testing()
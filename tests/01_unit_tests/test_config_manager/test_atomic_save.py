@@ -0,0 +1,111 @@
+# tests/01_unit_tests/test_config_manager/test_atomic_save.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+import stat
+import subprocess
+import sys
+import pytest
+
+from config_manager.core.file_operations import FileOperations
+
+
+def test_save_leaves_no_temp_files(tmp_path):
+    """保存后目录中不残留临时文件"""
+    config_file = str(tmp_path / 'config.yaml')
+    backup_file = str(tmp_path / 'backup' / 'config_backup.yaml')
+
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'demo'}}, backup_file)
+
+    assert sorted(os.listdir(tmp_path)) == ['backup', 'config.yaml']
+    assert os.listdir(tmp_path / 'backup') == ['config_backup.yaml']
+    return
+
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason="Windows不使用POSIX权限位")
+def test_saved_file_mode_matches_open(tmp_path):
+    """新建配置文件的权限与open()创建的文件一致，而不是临时文件的0600"""
+    config_file = str(tmp_path / 'config.yaml')
+    reference_file = tmp_path / 'reference.txt'
+    with open(reference_file, 'w', encoding='utf-8'):
+        pass
+
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'demo'}})
+
+    assert stat.S_IMODE(os.stat(config_file).st_mode) == stat.S_IMODE(os.stat(reference_file).st_mode)
+    return
+
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason="Windows不使用POSIX权限位")
+def test_new_files_respect_restrictive_umask(tmp_path):
+    """umask 077下新建的配置文件和备份文件仅所有者可读写"""
+    config_file = tmp_path / 'config.yaml'
+    backup_file = tmp_path / 'backup' / 'config_backup.yaml'
+    # 在子进程中设置umask，不影响当前测试进程中的其他线程
+    script = (
+        "import os, sys\n"
+        "os.umask(0o077)\n"
+        "from config_manager.core.file_operations import FileOperations\n"
+        "ok = FileOperations().save_config(sys.argv[1], {'__data__': {'name': 'demo'}}, sys.argv[2])\n"
+        "sys.exit(0 if ok else 1)\n"
+    )
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, '-c', script, str(config_file), str(backup_file)],
+                            env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(backup_file).st_mode) == 0o600
+    return
+
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason="Windows不使用POSIX权限位")
+def test_existing_file_mode_is_kept(tmp_path):
+    """覆盖已有配置文件时沿用其权限"""
+    config_file = str(tmp_path / 'config.yaml')
+    file_ops = FileOperations()
+
+    assert file_ops.save_config(config_file, {'__data__': {'name': 'demo'}})
+    os.chmod(config_file, 0o600)
+    assert file_ops.save_config(config_file, {'__data__': {'name': 'changed'}})
+
+    assert stat.S_IMODE(os.stat(config_file).st_mode) == 0o600
+    return
+
+
+def test_identical_backup_is_not_rewritten(tmp_path):
+    """备份内容未变化时不重复写入备份文件"""
+    config_file = str(tmp_path / 'config.yaml')
+    backup_file = str(tmp_path / 'backup' / 'config_backup.yaml')
+    file_ops = FileOperations()
+    data = {'__data__': {'name': 'demo'}}
+
+    assert file_ops.save_config(config_file, data, backup_file)
+    first_mtime = os.stat(backup_file).st_mtime_ns
+    os.utime(backup_file, ns=(first_mtime - 10 ** 9, first_mtime - 10 ** 9))
+
+    assert file_ops.save_config(config_file, data, backup_file)
+    assert os.stat(backup_file).st_mtime_ns == first_mtime - 10 ** 9
+
+    # 内容变化后正常写入备份
+    assert file_ops.save_config(config_file, {'__data__': {'name': 'changed'}}, backup_file)
+    with open(backup_file, 'r', encoding='utf-8') as f:
+        assert 'changed' in f.read()
+    return
+
+
+def test_backup_matches_saved_config(tmp_path):
+    """重复键在写入前从文本中删除，主配置与备份内容一致"""
+    config_file = tmp_path / 'config.yaml'
+    backup_file = tmp_path / 'backup' / 'config_backup.yaml'
+    file_ops = FileOperations()
+
+    assert file_ops.save_config(str(config_file), {'__data__': {'name': 'demo'}, '__type_hints__': {}}, str(backup_file))
+
+    assert config_file.read_text(encoding='utf-8') == backup_file.read_text(encoding='utf-8')
+    text = config_file.read_text(encoding='utf-8')
+    assert file_ops._remove_duplicate_keys_from_yaml_text(text) is text
+    return
@@ -5,14 +5,16 @@ from pathlib import Path
 import pytest
 from unittest.mock import patch
 
-from src.config_manager import get_config_manager, _clear_instances_for_testing
+from src.config_manager import get_config_manager
+
+pytestmark = pytest.mark.usefixtures("clear_instances_fixture")
+
+
+@pytest.fixture(scope="module")
+def existing_dir(tmp_path_factory) -> Path:
+    """模块内共享的已存在目录"""
+    return tmp_path_factory.mktemp("already_exists")
 
-@pytest.fixture(autouse=True)
-def clear_instances_fixture():
-    """在每个测试前后自动清理ConfigManager单例"""
-    _clear_instances_for_testing()
-    yield
-    _clear_instances_for_testing()
 
 class TestAutoDirectoryCreation:
     def test_paths_namespace_auto_creation(self, tmp_path: Path):
@@ -73,11 +75,8 @@ class TestAutoDirectoryCreation:
     def test_permission_error_handling(self, mock_makedirs, tmp_path: Path):
         pytest.skip("路径不再自动创建，此测试已不适用")
 
-    def test_existing_directory_handling(self, tmp_path):
+    def test_existing_directory_handling(self, tmp_path, existing_dir):
         """测试已存在目录的处理"""
-        existing_dir = tmp_path / "already_exists"
-        existing_dir.mkdir()
-        
         config = get_config_manager(test_mode=True, first_start_time=datetime(2025, 1, 7, 15, 30, 0))
         config.set('base_dir', str(tmp_path))
         config.set('project_name', 'test_project')
@@ -88,12 +87,11 @@ class TestAutoDirectoryCreation:
         
         # 验证路径被正确设置，但不自动创建
         assert config.get('paths.my_path') == str(existing_dir)
-        assert existing_dir.exists()  # 目录应该存在，因为我们在测试中创建了它
+        assert existing_dir.is_dir()  # 目录由模块级fixture预先创建
 
     def test_windows_path_formats(self, tmp_path):
         """测试Windows路径格式处理"""
         backslash_path = tmp_path / "backslash_style"
-        backslash_path.mkdir()
         
         config = get_config_manager(test_mode=True, first_start_time=datetime(2025, 1, 7, 15, 30, 0))
         config.set('base_dir', str(tmp_path))
@@ -104,5 +102,4 @@ class TestAutoDirectoryCreation:
         config.set('paths.backslash_dir', str(backslash_path))
         
         # 验证路径被正确设置，但不自动创建
-        assert config.get('paths.backslash_dir') == str(backslash_path)
-        assert backslash_path.exists()  # 目录应该存在，因为我们在测试中创建了它 
\ No newline at end of file
+        assert config.get('paths.backslash_dir') == str(backslash_path) 
\ No newline at end of file
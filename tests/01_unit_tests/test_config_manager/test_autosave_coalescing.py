@@ -0,0 +1,60 @@
+# tests/01_unit_tests/test_config_manager/test_autosave_coalescing.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import time
+import threading
+from unittest.mock import Mock
+
+from config_manager.core.autosave_manager import AutosaveManager
+
+
+def test_repeated_schedule_reuses_pending_timer():
+    """延迟窗口内重复调度只使用同一个定时器，并且只保存一次"""
+    autosave_manager = AutosaveManager(autosave_delay=0.1)
+    save_callback = Mock(return_value=True)
+
+    try:
+        autosave_manager.schedule_save(save_callback)
+        first_timer = autosave_manager._autosave_timer
+        for _ in range(20):
+            autosave_manager.schedule_save(save_callback)
+        assert autosave_manager._autosave_timer is first_timer
+
+        time.sleep(0.3)
+        assert save_callback.call_count == 1
+        assert autosave_manager._autosave_timer is None
+    finally:
+        autosave_manager.cleanup()
+    return
+
+
+def test_change_during_save_schedules_another_save():
+    """保存执行期间发生的修改会再触发一次保存"""
+    autosave_manager = AutosaveManager(autosave_delay=0.05)
+    saving = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_save():
+        calls.append(time.time())
+        if len(calls) == 1:
+            saving.set()
+            release.wait(1.0)
+        return True
+
+    try:
+        autosave_manager.schedule_save(slow_save)
+        assert saving.wait(1.0)
+
+        # 第一次保存尚未结束时再次修改
+        autosave_manager.schedule_save(slow_save)
+        release.set()
+
+        time.sleep(0.3)
+        assert len(calls) == 2
+    finally:
+        autosave_manager.cleanup()
+    return
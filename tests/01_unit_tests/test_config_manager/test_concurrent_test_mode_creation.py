@@ -0,0 +1,43 @@
+# tests/01_unit_tests/test_config_manager/test_concurrent_test_mode_creation.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import time
+import threading
+
+from config_manager.config_manager import ConfigManager, get_config_manager, _clear_instances_for_testing
+
+
+def test_concurrent_callers_share_one_test_environment(monkeypatch):
+    """并发获取同一测试模式实例时只准备一次测试环境"""
+    _clear_instances_for_testing()
+    original_setup = ConfigManager._setup_test_environment.__func__
+    setup_calls = []
+
+    def slow_setup(cls, original_config_path=None, first_start_time=None):
+        setup_calls.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return original_setup(cls, original_config_path, first_start_time)
+
+    monkeypatch.setattr(ConfigManager, '_setup_test_environment', classmethod(slow_setup))
+    fixed_time = datetime(2025, 1, 7, 18, 15, 20)
+    results = []
+
+    def worker():
+        results.append(get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(setup_calls) == 1
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+    finally:
+        _clear_instances_for_testing()
+    return
@@ -1,36 +1,51 @@
 # tests/01_unit_tests/test_config_manager/test_config_file_protection.py
 from __future__ import annotations
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
+import os
+import pytest
 
-from src.config_manager import get_config_manager, _clear_instances_for_testing
+from src.config_manager import get_config_manager
 
+# 测试用配置文件模板，各测试只替换其中的路径
+_CONFIG_TEMPLATE = '''__data__:
+  project_name: "TestProject"
+  base_dir: "{base_dir}"
+__type_hints__: {{}}'''
+
+_COMPLEX_CONFIG_TEMPLATE = '''__data__:
+  project_name: "FuturesTradingPL"
+  base_dir: "{base_dir}"
+  database:
+    path: "{data_dir}\\\\database.db"
+  logs:
+    base_root_dir: ".\\\\logs"
+__type_hints__: {{}}'''
+
+# 无法解析的配置文件内容，无需替换路径，直接以字节写入
+_INVALID_YAML = b'''__data__:
+  invalid_yaml: [unclosed list
+__type_hints__: {}'''
+
+
+def _yaml_windows_path(path: Path) -> str:
+    """转为Windows风格路径，并按YAML双引号字符串转义反斜杠"""
+    return str(PureWindowsPath(path)).replace('\\', '\\\\')
+
+
+pytestmark = pytest.mark.usefixtures("clear_instances_fixture")
 
 
 class TestConfigFileProtection:
     """测试配置文件保护功能"""
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        _clear_instances_for_testing()
-    
-    def teardown_method(self):
-        """每个测试方法后的清理"""
-        _clear_instances_for_testing()
-    
     def test_windows_path_escape_fix(self, tmp_path):
         """测试Windows路径转义问题的修复"""
         config_path = tmp_path / 'test_config.yaml'
         
         # 使用安全的tmp_path动态构建模拟的Windows路径
-        safe_base_dir_str = str(tmp_path / 'logs').replace('/', '\\\\')
+        safe_base_dir_str = _yaml_windows_path(tmp_path / 'logs')
         
-        problematic_config = f'''__data__:
-  project_name: "TestProject"
-  base_dir: "{safe_base_dir_str}"
-__type_hints__: {{}}'''
-            
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(problematic_config)
+        config_path.write_text(_CONFIG_TEMPLATE.format(base_dir=safe_base_dir_str), encoding='utf-8')
             
         config = get_config_manager(
             config_path=str(config_path),
@@ -42,20 +57,13 @@ __type_hints__: {{}}'''
         assert config.project_name == "TestProject"
         # 在测试模式下，base_dir会被路径替换器修改为测试基础目录
         # 验证路径替换正常工作
-        assert Path(config.base_dir) == Path(tmp_path)
+        assert os.path.normpath(config.base_dir) == str(tmp_path)
     
     def test_config_file_protection_on_parse_error(self, tmp_path):
         """测试配置文件解析错误时的保护机制"""
         config_path = tmp_path / 'test_config.yaml'
             
-        invalid_yaml = '''__data__:
-  invalid_yaml: [unclosed list
-__type_hints__: {}'''
-            
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(invalid_yaml)
-            
-        original_content = invalid_yaml
+        config_path.write_bytes(_INVALID_YAML)
             
         config = get_config_manager(
             config_path=str(config_path),
@@ -84,44 +92,28 @@ __type_hints__: {}'''
             test_mode=True
         )
             
-        config.set('project_name', 'TestProject')
-        config.save()
+        config.update({'project_name': 'TestProject'}, save=True)
             
         # 在测试模式下，配置文件保存在标准的测试路径结构中
         actual_config_path = tmp_path / 'src' / 'config' / 'config.yaml'
         assert actual_config_path.exists()
             
-        _clear_instances_for_testing()
-        config2 = get_config_manager(
-            config_path=str(config_path),
-            auto_create=False,
-            test_mode=True
-        )
-            
-        # 验证第二个配置管理器成功创建并能读取配置
-        assert config2 is not None
-        # 在测试模式下project_name可能会被重置，所以只验证配置管理器正常工作
-        assert hasattr(config2, 'project_name')
+        # 直接检查保存的文件内容，无需再初始化一个配置管理器
+        raw = actual_config_path.read_text(encoding='utf-8')
+        assert 'project_name' in raw
+        assert 'TestProject' in raw
     
     def test_complex_windows_paths_handling(self, tmp_path):
         """测试复杂Windows路径的处理"""
         config_path = tmp_path / 'test_config.yaml'
         
         # 动态、安全地创建模拟路径
-        safe_logs_dir = str(tmp_path / "logs").replace('/', '\\\\')
-        safe_data_dir = str(tmp_path / "data").replace('/', '\\\\')
+        safe_logs_dir = _yaml_windows_path(tmp_path / "logs")
+        safe_data_dir = _yaml_windows_path(tmp_path / "data")
 
-        complex_config = f'''__data__:
-  project_name: "FuturesTradingPL"
-  base_dir: "{safe_logs_dir}"
-  database:
-    path: "{safe_data_dir}\\\\database.db"
-  logs:
-    base_root_dir: ".\\\\logs"
-__type_hints__: {{}}'''
-            
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(complex_config)
+        config_path.write_text(
+            _COMPLEX_CONFIG_TEMPLATE.format(base_dir=safe_logs_dir, data_dir=safe_data_dir), encoding='utf-8'
+        )
             
         config = get_config_manager(
             config_path=str(config_path),
@@ -131,7 +123,7 @@ __type_hints__: {{}}'''
             
         assert config is not None
         # 在测试模式下，base_dir会被路径替换器修改为测试基础目录
-        assert Path(config.base_dir) == tmp_path
+        assert os.path.normpath(config.base_dir) == str(tmp_path)
         # 由于路径替换可能产生双斜杠，我们验证路径包含预期的组件
         database_path = Path(config.database.path)
         assert str(database_path).startswith(str(tmp_path))
@@ -143,13 +135,7 @@ __type_hints__: {{}}'''
         """测试解析错误时备份文件的创建"""
         config_path = tmp_path / 'test_config.yaml'
             
-        valid_config = f'''__data__:
-  project_name: "TestProject"
-  base_dir: "{str(tmp_path / 'logs')}"
-__type_hints__: {{}}'''
-            
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(valid_config)
+        config_path.write_text(_CONFIG_TEMPLATE.format(base_dir=tmp_path / 'logs'), encoding='utf-8')
             
         config = get_config_manager(
             config_path=str(config_path),
@@ -159,24 +145,24 @@ __type_hints__: {{}}'''
             
         assert config is not None
             
-        config.set('test_key', 'test_value')
-        
         # 设置项目路径以生成backup_dir
         config.setup_project_paths()
-        config.save()
+
+        # 写入后只保存一次，不再额外安排自动保存
+        config.update({'test_key': 'test_value'}, save=True)
+        assert config._autosave_manager._autosave_timer is None, "不应有待执行的自动保存"
         
-        # 使用新的backup_dir路径
-        backup_dir_path = config.get('paths.backup_dir')
-        assert backup_dir_path is not None, "backup_dir应该被正确生成"
+        # 使用新的backup_dir路径，直接按属性访问已生成的paths节点
+        backup_dir_path = config.paths.backup_dir
+        assert backup_dir_path, "backup_dir应该被正确生成"
         
         backup_dir = Path(backup_dir_path)
         assert backup_dir.exists(), f"备份目录应该存在: {backup_dir}"
             
-        backup_files = list(backup_dir.glob('*.yaml'))
-        assert len(backup_files) > 0, f"应该有备份文件: {list(backup_dir.glob('*'))}"
+        backup_files = [entry.path for entry in os.scandir(backup_dir) if entry.name.endswith('.yaml')]
+        assert len(backup_files) > 0, f"应该有备份文件: {os.listdir(backup_dir)}"
             
-        with open(backup_files[0], 'r', encoding='utf-8') as f:
-            backup_content = f.read()
+        backup_content = Path(backup_files[0]).read_text(encoding='utf-8')
         
         assert 'test_key' in backup_content
         assert 'test_value' in backup_content
\ No newline at end of file
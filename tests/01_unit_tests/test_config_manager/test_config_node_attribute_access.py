@@ -0,0 +1,32 @@
+# tests/01_unit_tests/test_config_manager/test_config_node_attribute_access.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import pytest
+
+from config_manager.config_node import ConfigNode
+
+
+def test_plain_keys_and_missing_attributes():
+    """普通键直接返回，缺失键抛出AttributeError并支持getattr默认值"""
+    node = ConfigNode({'nested': {'level1': {'level2': 'deep'}}, 'count': 3})
+
+    assert node.count == 3
+    assert node.nested.level1.level2 == 'deep'
+    assert getattr(node.nested, 'missing', 'NOT_FOUND') == 'NOT_FOUND'
+    with pytest.raises(AttributeError):
+        _ = node.missing
+    return
+
+
+def test_raw_dict_value_is_wrapped_on_access():
+    """直接写入_data的原始字典在访问时转换为ConfigNode"""
+    node = ConfigNode()
+    node._data['raw'] = {'host': 'localhost'}
+
+    assert isinstance(node.raw, ConfigNode)
+    assert node.raw is node._data['raw']
+    assert node.raw.host == 'localhost'
+    return
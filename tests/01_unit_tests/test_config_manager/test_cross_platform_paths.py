@@ -15,12 +15,7 @@ from src.config_manager.core.cross_platform_paths import (
     get_platform_path
 )
 
-@pytest.fixture(autouse=True)
-def clear_instances_fixture():
-    """在每个测试前后自动清理ConfigManager单例"""
-    _clear_instances_for_testing()
-    yield
-    _clear_instances_for_testing()
+pytestmark = pytest.mark.usefixtures("clear_instances_fixture")
 
 class TestCrossPlatformPathManager:
     """跨平台路径管理器测试类"""
@@ -335,21 +330,22 @@ class TestCrossPlatformPathIntegration:
                 'ubuntu': '/home/tony/multi_logs',
                 'macos': '/Users/tony/multi_logs'
             }
-            config.set('base_dir', multi_platform_base_dir)
+            if config._path_config_manager is None:
+                pytest.skip("路径配置管理器未初始化")
             
-            # 设置项目配置
-            config.set('project_name', 'test_project')
-            config.set('experiment_name', 'test_exp')
+            # 批量设置base_dir和项目配置，路径配置只重新生成一次
+            config.update({
+                'base_dir': multi_platform_base_dir,
+                'project_name': 'test_project',
+                'experiment_name': 'test_exp',
+            })
             
             # 验证路径配置管理器能够正确处理
-            try:
-                path_info = config.get_path_configuration_info()
-                assert 'current_os' in path_info
-                assert 'generated_paths' in path_info
-            except Exception:
-                # 如果路径配置管理器不可用，至少验证基本功能
-                current_base_dir = config.get('base_dir')
-                assert current_base_dir is not None
+            path_info = config.get_path_configuration_info()
+            assert 'current_os' in path_info
+            assert 'generated_paths' in path_info
+            assert path_info['project_name'] == 'test_project'
+            assert path_info['experiment_name'] == 'test_exp'
 
     def test_backward_compatibility(self):
         """测试向后兼容性"""
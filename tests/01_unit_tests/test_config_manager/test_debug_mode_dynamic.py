@@ -9,12 +9,7 @@ from pathlib import Path
 
 from src.config_manager import get_config_manager, _clear_instances_for_testing
 
-@pytest.fixture(autouse=True)
-def clear_instances_fixture():
-    """在每个测试前后自动清理ConfigManager单例"""
-    _clear_instances_for_testing()
-    yield
-    _clear_instances_for_testing()
+pytestmark = pytest.mark.usefixtures("clear_instances_fixture")
 
 
 class TestDebugModeDynamic:
@@ -0,0 +1,51 @@
+# tests/01_unit_tests/test_config_manager/test_frozen_tsb_logs_dir.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+from unittest.mock import patch
+
+from config_manager.core.dynamic_paths import DynamicPathProperty, PathsConfigNode
+from config_manager.core.path_resolver import PathResolver
+
+
+class _Root:
+    """只提供first_start_time的配置管理器替身"""
+
+    def __init__(self, first_start_time):
+        self.first_start_time = first_start_time
+        return
+
+
+def test_path_frozen_until_inputs_change():
+    """work_dir和first_start_time不变时只生成一次路径，任一变化后重新生成"""
+    root = _Root('2025-01-08T10:30:45')
+    node = PathsConfigNode({'work_dir': '/tmp/frozen'}, root=root)
+    property_obj = DynamicPathProperty(cache_duration=0)
+
+    with patch.object(PathResolver, 'generate_tsb_logs_path',
+                      wraps=PathResolver.generate_tsb_logs_path) as generate:
+        first = property_obj.__get__(node, PathsConfigNode)
+        assert property_obj.__get__(node, PathsConfigNode) == first
+        assert generate.call_count == 1
+
+        root.first_start_time = '2025-02-08T10:30:45'
+        second = property_obj.__get__(node, PathsConfigNode)
+        assert second != first
+        assert '0208' in second
+        assert generate.call_count == 2
+
+        node.work_dir = '/tmp/frozen_other'
+        assert property_obj.__get__(node, PathsConfigNode).startswith('/tmp/frozen_other')
+        assert generate.call_count == 3
+    return
+
+
+def test_path_without_start_time_not_frozen():
+    """没有first_start_time时路径取决于当前时间，不冻结"""
+    node = PathsConfigNode({'work_dir': '/tmp/frozen'}, root=_Root(None))
+
+    DynamicPathProperty(cache_duration=0).__get__(node, PathsConfigNode)
+    assert '_frozen_tsb_logs_dir' not in node.__dict__
+    return
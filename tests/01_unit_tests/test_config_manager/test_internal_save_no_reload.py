@@ -4,6 +4,7 @@ from datetime import datetime
 
 start_time = datetime.now()
 
+import shutil
 import tempfile
 import os
 import time
@@ -26,9 +27,7 @@ class TestInternalSaveNoReload:
     
     def teardown_method(self):
         """测试后清理"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_internal_save_no_reload(self):
         """测试内部保存不会触发重新加载"""
@@ -100,7 +99,6 @@ class TestInternalSaveNoReload:
             os.makedirs(os.path.dirname(watched_file), exist_ok=True)
             # 复制当前配置到监视文件
             if os.path.exists(cfg._config_path):
-                import shutil
                 shutil.copy2(cfg._config_path, watched_file)
             else:
                 # 如果实际配置文件也不存在，创建一个基本的配置文件
@@ -5,6 +5,7 @@ import pytest
 import threading
 import time
 import os
+import shutil
 import tempfile
 import atexit
 from unittest.mock import patch, Mock
@@ -25,10 +26,11 @@ class TestInterpreterShutdownSafety:
 
     def teardown_method(self):
         """测试后清理"""
-        import shutil
         # 清理整个测试目录
-        if os.path.exists(self.test_dir):
+        try:
             shutil.rmtree(self.test_dir)
+        except FileNotFoundError:
+            pass
 
     def test_autosave_manager_shutdown_flag(self):
         """测试自动保存管理器的关闭标志功能"""
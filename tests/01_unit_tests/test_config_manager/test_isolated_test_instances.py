@@ -0,0 +1,69 @@
+# tests/01_unit_tests/test_config_manager/test_isolated_test_instances.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import threading
+
+from config_manager.config_manager import (
+    ConfigManager, get_config_manager, _clear_instances_for_testing, isolated_test_instances,
+)
+
+
+def test_isolated_context_uses_own_registry():
+    """隔离上下文中创建、清理实例不影响共享缓存"""
+    _clear_instances_for_testing()
+    fixed_time = datetime(2025, 1, 7, 18, 15, 20)
+    try:
+        shared = get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time)
+
+        with isolated_test_instances():
+            assert len(ConfigManager._instances) == 0
+            isolated = get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time)
+            assert isolated is not shared
+            assert get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time) is isolated
+
+            _clear_instances_for_testing()
+            assert len(ConfigManager._instances) == 0
+
+        assert get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time) is shared
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_isolated_clear_keeps_production_instances(tmp_path):
+    """隔离上下文中清理实例不影响进程共享的生产模式实例"""
+    _clear_instances_for_testing()
+    try:
+        production = get_config_manager(config_path=str(tmp_path / 'config.yaml'), watch=False)
+
+        with isolated_test_instances():
+            _clear_instances_for_testing()
+            assert any(instance is production for instance in ConfigManager._production_instances.values())
+
+        assert get_config_manager(config_path=str(tmp_path / 'config.yaml'), watch=False) is production
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_threads_without_isolation_share_registry():
+    """未隔离的线程仍共享同一个实例缓存"""
+    _clear_instances_for_testing()
+    fixed_time = datetime(2025, 1, 7, 18, 15, 20)
+    results = []
+
+    def worker():
+        results.append(get_config_manager(test_mode=True, watch=False, first_start_time=fixed_time))
+
+    try:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert len(results) == 1
+        assert any(instance is results[0] for instance in ConfigManager._instances.values())
+    finally:
+        _clear_instances_for_testing()
+    return
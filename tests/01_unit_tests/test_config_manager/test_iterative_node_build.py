@@ -0,0 +1,66 @@
+# tests/01_unit_tests/test_config_manager/test_iterative_node_build.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import sys
+
+from config_manager.config_node import ConfigNode
+from config_manager.core.manager import ConfigManagerCore
+
+
+def test_build_nested_structure():
+    """嵌套字典、列表中的字典和字符串化列表都被正确构建"""
+    data = {
+        'nested': {'level1': {'level2': 'deep'}},
+        'servers': [{'host': 'a'}, {'host': 'b'}, [1, {'port': 80}]],
+        'tags': "['x', 'y']",
+        'debug_mode': True,
+        'inner': {'__type_hints__': {'bad': 'data'}, 'ok': 1},
+    }
+
+    node = ConfigManagerCore()._build_config_node(data)
+
+    assert isinstance(node, ConfigNode)
+    assert node.nested.level1.level2 == 'deep'
+    assert isinstance(node.servers[0], ConfigNode)
+    assert [server.host for server in node.servers[:2]] == ['a', 'b']
+    assert node.servers[2][0] == 1
+    assert node.servers[2][1].port == 80
+    assert node.tags == ['x', 'y']
+    # 系统键在各层级都被过滤
+    assert 'debug_mode' not in node._data
+    assert '__type_hints__' not in node.inner._data
+    assert node.inner.ok == 1
+    return
+
+
+def test_build_deeper_than_recursion_limit():
+    """嵌套层级超过递归限制时仍能构建"""
+    depth = sys.getrecursionlimit() + 100
+    data = current = {}
+    for _ in range(depth):
+        current['child'] = {}
+        current = current['child']
+    current['value'] = 'bottom'
+
+    node = ConfigManagerCore()._build_config_node(data)
+
+    for _ in range(depth):
+        node = node._data['child']
+    assert node._data['value'] == 'bottom'
+    return
+
+
+def test_build_interns_string_keys():
+    """构建时字符串键被驻留，不同实例共享同一个键对象"""
+    # 运行时拼接的字符串不会自动驻留
+    key = ''.join(['project', '_', 'name_interned'])
+
+    node = ConfigManagerCore()._build_config_node({'nested': {key: 'demo'}, 1: 'int_key'})
+
+    built_key = next(iter(node.nested._data))
+    assert built_key is sys.intern('project_name_interned')
+    assert node._data[1] == 'int_key'
+    return
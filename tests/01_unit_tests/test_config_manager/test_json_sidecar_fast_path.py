@@ -0,0 +1,102 @@
+# tests/01_unit_tests/test_config_manager/test_json_sidecar_fast_path.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+import json
+import time
+import shutil
+import pytest
+
+from config_manager.core.file_operations import FileOperations
+
+
+@pytest.fixture
+def fast_json_io(monkeypatch):
+    """开启JSON旁路文件"""
+    monkeypatch.setattr(FileOperations, 'FAST_JSON_IO', True)
+    return
+
+
+def test_sidecar_not_written_by_default(tmp_path):
+    """默认关闭时不生成JSON旁路文件"""
+    config_file = str(tmp_path / 'config.yaml')
+    file_ops = FileOperations()
+
+    assert file_ops.save_config(config_file, {'__data__': {'name': 'demo'}, '__type_hints__': {}})
+    assert not os.path.exists(FileOperations.get_json_sidecar_path(config_file))
+    return
+
+
+def test_sidecar_written_and_loaded(tmp_path, fast_json_io):
+    """保存后生成旁路文件，加载时优先读取旁路文件"""
+    config_file = str(tmp_path / 'config.yaml')
+    data = {'__data__': {'name': 'demo', 'nested': {'value': 1}}, '__type_hints__': {}}
+
+    assert FileOperations().save_config(config_file, data)
+    sidecar_path = FileOperations.get_json_sidecar_path(config_file)
+    assert os.path.exists(sidecar_path)
+    with open(sidecar_path, 'r', encoding='utf-8') as f:
+        sidecar = json.load(f)
+    assert sidecar['data'] == data
+    st = os.stat(config_file)
+    assert sidecar['yaml_signature'] == [st.st_mtime_ns, st.st_size]
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded == data
+    return
+
+
+def test_yaml_newer_than_sidecar_wins(tmp_path, fast_json_io):
+    """YAML在旁路文件之后被修改时以YAML为准"""
+    config_file = str(tmp_path / 'config.yaml')
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'old'}, '__type_hints__': {}})
+
+    time.sleep(0.01)
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write("__data__:\n  name: edited\n__type_hints__: {}\n")
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['name'] == 'edited'
+    return
+
+
+def test_yaml_restored_with_older_mtime_wins(tmp_path, fast_json_io):
+    """YAML以保留旧mtime的方式还原（如cp -p）时不使用旁路文件"""
+    config_file = str(tmp_path / 'config.yaml')
+    old_copy = str(tmp_path / 'config_old.yaml')
+    assert FileOperations().save_config(config_file, {'__data__': {'v': 'old'}, '__type_hints__': {}})
+    shutil.copy2(config_file, old_copy)
+
+    time.sleep(0.01)
+    assert FileOperations().save_config(config_file, {'__data__': {'v': 'new'}, '__type_hints__': {}})
+    shutil.copy2(old_copy, config_file)
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['v'] == 'old'
+    return
+
+
+def test_save_after_sidecar_load_keeps_comments(tmp_path, fast_json_io):
+    """从旁路文件加载后再保存，YAML中的注释仍然保留"""
+    config_file = str(tmp_path / 'config.yaml')
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write("__data__:\n  # 项目名称\n  name: demo\n__type_hints__: {}\n")
+    yaml_ops = FileOperations()
+    assert yaml_ops.load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert yaml_ops.save_config(config_file, {'__data__': {'name': 'demo'}, '__type_hints__': {}})
+    assert os.path.exists(FileOperations.get_json_sidecar_path(config_file))
+
+    file_ops = FileOperations()
+    loaded = file_ops.load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert file_ops._original_yaml_data is None, "应该从JSON旁路文件加载"
+    loaded['__data__']['name'] = 'changed'
+    assert file_ops.save_config(config_file, loaded)
+
+    with open(config_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    assert '# 项目名称' in content
+    assert 'changed' in content
+    return
@@ -140,8 +140,10 @@ class TestMultiPlatformBaseDir:
         
         assert re.match(pattern, main_path), f"路径格式不正确: {main_path}，期望模式: {pattern}"
 
-    def test_platform_default_values(self):
+    def test_platform_default_values(self, tmp_path, monkeypatch):
         """测试平台默认值"""
+        # Linux默认值~/logs会展开到用户目录，让生成的路径和备份落在临时目录中
+        monkeypatch.setenv('HOME', str(tmp_path))
         cfg = get_config_manager(test_mode=True)
         
         # 设置一个Windows路径，测试Linux默认值
@@ -153,6 +155,8 @@ class TestMultiPlatformBaseDir:
         # 验证默认值
         assert config_dict['windows'] == 'D:\\Windows\\Project', "Windows路径应该保持原值"
         assert config_dict['linux'] == '~/logs', "Linux应该使用默认值"
+        if platform.system() == 'Linux':
+            assert cfg.paths.work_dir.startswith(str(tmp_path)), "~应展开为用户目录，而不是当前目录下的~目录"
 
     def test_tilde_expansion(self):
         """测试波浪线路径展开"""
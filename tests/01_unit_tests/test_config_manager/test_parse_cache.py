@@ -0,0 +1,89 @@
+# tests/01_unit_tests/test_config_manager/test_parse_cache.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+import pytest
+
+from config_manager.core.file_operations import FileOperations
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """每个测试前后清空解析缓存"""
+    FileOperations.clear_parse_cache()
+    yield
+    FileOperations.clear_parse_cache()
+    return
+
+
+def write_config(config_file, name):
+    """写入简单的配置文件"""
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write(f"__data__:\n  name: {name}\n__type_hints__: {{}}\n")
+    return
+
+
+def test_unchanged_file_is_not_parsed_again(tmp_path, monkeypatch):
+    """文件未变化时第二次加载不再解析YAML"""
+    config_file = str(tmp_path / 'config.yaml')
+    write_config(config_file, 'demo')
+    assert FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+
+    file_ops = FileOperations()
+    monkeypatch.setattr(file_ops._yaml, 'load', lambda content: pytest.fail("不应重新解析"))
+    loaded = file_ops.load_config(config_file, auto_create=False, call_chain_tracker=None)
+
+    assert loaded['__data__']['name'] == 'demo'
+    assert file_ops._original_yaml_data is loaded
+    return
+
+
+def test_save_does_not_modify_shared_cache(tmp_path):
+    """保存时先复制共享的缓存数据，不影响其他实例持有的原始结构"""
+    config_file = str(tmp_path / 'config.yaml')
+    write_config(config_file, 'demo')
+
+    writer = FileOperations()
+    loaded = writer.load_config(config_file, auto_create=False, call_chain_tracker=None)
+    reader = FileOperations()
+    shared = reader.load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert shared is loaded, "未变化的文件应共享同一份解析结果"
+
+    assert writer.save_config(config_file, {'__data__': {'name': 'changed'}, '__type_hints__': {}})
+
+    assert reader._original_yaml_data['__data__']['name'] == 'demo'
+    assert writer._original_yaml_data is not shared
+    return
+
+
+def test_modified_file_is_parsed_again(tmp_path):
+    """文件修改后重新解析"""
+    config_file = str(tmp_path / 'config.yaml')
+    write_config(config_file, 'old')
+    assert FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+
+    write_config(config_file, 'newer')
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['name'] == 'newer'
+    return
+
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """超过容量时淘汰最久未使用的条目"""
+    monkeypatch.setattr(FileOperations, 'PARSE_CACHE_SIZE', 2)
+    paths = []
+    for index in range(3):
+        config_file = str(tmp_path / f'config_{index}.yaml')
+        write_config(config_file, f'name_{index}')
+        FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+        paths.append(os.path.abspath(config_file))
+
+    cached_paths = [key[0] for key in FileOperations._parse_cache]
+    assert cached_paths == paths[1:]
+    return
@@ -1,18 +1,14 @@
 # tests/01_unit_tests/test_config_manager/test_path_configuration.py
 from __future__ import annotations
 from pathlib import Path
+import os
 import pytest
 import tempfile
 from unittest.mock import Mock, patch
 
-from src.config_manager import get_config_manager, _clear_instances_for_testing
+from src.config_manager import get_config_manager
 
-@pytest.fixture(autouse=True)
-def clear_instances_fixture():
-    """在每个测试前后自动清理ConfigManager单例"""
-    _clear_instances_for_testing()
-    yield
-    _clear_instances_for_testing()
+pytestmark = pytest.mark.usefixtures("clear_instances_fixture")
 
 # 导入被测试的模块
 from src.config_manager.core.path_configuration import (
@@ -152,6 +148,26 @@ class TestPathGenerator:
         }
         assert result_with_time == expected_with_time
 
+    def test_generate_derived_directories(self, tmp_path):
+        """测试一次生成的派生目录与逐项生成结果一致"""
+        generator = PathGenerator()
+        work_dir = tmp_path / 'test_project' / 'exp_001'
+        date_str = '20250108'
+        time_str = '103045'
+
+        # 末尾带分隔符的工作目录也应按Path规范化
+        result = generator.generate_derived_directories(str(work_dir) + os.sep, date_str, time_str)
+        expected = {
+            'checkpoint_dir': str(work_dir / 'checkpoint'),
+            'best_checkpoint_dir': str(work_dir / 'checkpoint' / 'best'),
+            'debug_dir': str(work_dir / 'debug' / date_str / time_str),
+            'log_dir': str(work_dir / 'logs' / date_str / time_str),
+            'backup_dir': str(work_dir / 'backup' / date_str / time_str),
+            'cache_dir': str(work_dir / 'cache'),
+        }
+        assert result == expected
+        assert list(result) == list(expected)
+
 
 
 class TestPathValidator:
@@ -9,7 +9,9 @@ import threading
 import time
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+tests_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if tests_dir not in sys.path:
+    sys.path.insert(0, tests_dir)
 from utils.path_test_helper import PathTestHelper
 from config_manager import get_config_manager
 
@@ -23,8 +25,10 @@ class TestPathConsistency:
         
     def teardown_method(self):
         """测试后清理"""
-        if os.path.exists(self.test_dir):
+        try:
             shutil.rmtree(self.test_dir)
+        except FileNotFoundError:
+            pass
     
     def test_tensorboard_dir_consistency(self):
         """测试tensorboard_dir与tsb_logs_dir的一致性"""
@@ -0,0 +1,91 @@
+# tests/01_unit_tests/test_config_manager/test_pickle_cache.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+import time
+import shutil
+import pytest
+
+from config_manager.core.file_operations import FileOperations
+
+
+@pytest.fixture
+def fast_pickle_io(monkeypatch):
+    """开启pickle缓存并清空解析缓存"""
+    monkeypatch.setattr(FileOperations, 'FAST_PICKLE_IO', True)
+    FileOperations.clear_parse_cache()
+    yield
+    FileOperations.clear_parse_cache()
+    return
+
+
+def test_cache_not_written_by_default(tmp_path):
+    """默认关闭时不生成pickle缓存"""
+    config_file = str(tmp_path / 'config.yaml')
+
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'demo'}, '__type_hints__': {}})
+    assert not os.path.exists(FileOperations.get_pickle_cache_path(config_file))
+    return
+
+
+def test_cache_keeps_datetime(tmp_path, fast_pickle_io):
+    """pickle缓存可以保存JSON无法表示的datetime"""
+    config_file = str(tmp_path / 'config.yaml')
+    data = {'__data__': {'first_start_time': datetime(2025, 1, 7, 18, 15, 20)}, '__type_hints__': {}}
+
+    assert FileOperations().save_config(config_file, data)
+    assert os.path.exists(FileOperations.get_pickle_cache_path(config_file))
+
+    file_ops = FileOperations()
+    loaded = file_ops.load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert file_ops._original_yaml_data is None, "应该从pickle缓存加载"
+    assert loaded == data
+    return
+
+
+def test_yaml_newer_than_cache_wins(tmp_path, fast_pickle_io):
+    """YAML在缓存之后被修改时以YAML为准"""
+    config_file = str(tmp_path / 'config.yaml')
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'old'}, '__type_hints__': {}})
+
+    time.sleep(0.01)
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write("__data__:\n  name: edited\n__type_hints__: {}\n")
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['name'] == 'edited'
+    return
+
+
+def test_yaml_restored_with_older_mtime_wins(tmp_path, fast_pickle_io):
+    """YAML以保留旧mtime的方式还原（如cp -p）时不使用pickle缓存"""
+    config_file = str(tmp_path / 'config.yaml')
+    old_copy = str(tmp_path / 'config_old.yaml')
+    assert FileOperations().save_config(config_file, {'__data__': {'v': 'old'}, '__type_hints__': {}})
+    shutil.copy2(config_file, old_copy)
+
+    time.sleep(0.01)
+    assert FileOperations().save_config(config_file, {'__data__': {'v': 'new'}, '__type_hints__': {}})
+    shutil.copy2(old_copy, config_file)
+    FileOperations.clear_parse_cache()
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['v'] == 'old'
+    return
+
+
+def test_corrupt_cache_is_removed(tmp_path, fast_pickle_io):
+    """无法反序列化的缓存被删除并回退到YAML"""
+    config_file = str(tmp_path / 'config.yaml')
+    assert FileOperations().save_config(config_file, {'__data__': {'name': 'demo'}, '__type_hints__': {}})
+    cache_path = FileOperations.get_pickle_cache_path(config_file)
+    with open(cache_path, 'wb') as f:
+        f.write(b'not a pickle')
+
+    loaded = FileOperations().load_config(config_file, auto_create=False, call_chain_tracker=None)
+    assert loaded['__data__']['name'] == 'demo'
+    assert not os.path.exists(cache_path)
+    return
@@ -0,0 +1,61 @@
+# tests/01_unit_tests/test_config_manager/test_set_unchanged_value.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+from unittest.mock import patch
+
+import pytest
+
+from config_manager.config_manager import ConfigManager, get_config_manager, _clear_instances_for_testing
+
+
+@pytest.fixture
+def config():
+    """测试模式配置管理器，测试前后清理实例"""
+    _clear_instances_for_testing()
+    yield get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+    _clear_instances_for_testing()
+
+
+def test_set_same_value_skips_path_update(config):
+    """重复设置相同的路径相关值时不重新生成路径配置"""
+    config.set('project_name', 'same_project', autosave=False)
+
+    with patch.object(ConfigManager, '_update_path_configuration', autospec=True) as update_paths:
+        config.set('project_name', 'same_project', autosave=False)
+        assert update_paths.call_count == 0
+
+        config.set('project_name', 'other_project', autosave=False)
+        assert update_paths.call_count == 1
+    assert config.project_name == 'other_project'
+    return
+
+
+def test_set_same_base_dir_skips_conversion_write(config, tmp_path):
+    """重复设置相同的base_dir时不重写多平台配置"""
+    config.set('base_dir', str(tmp_path), autosave=False)
+    stored = config._data['base_dir']
+
+    config.set('base_dir', str(tmp_path), autosave=False)
+    assert config._data['base_dir'] is stored
+
+    config.set('base_dir', str(tmp_path / 'other'), autosave=False)
+    assert config._data['base_dir'] is not stored
+    return
+
+
+def test_set_same_value_still_schedules_autosave(config):
+    """值未变化时仍按autosave参数安排保存，之前未保存的修改不会丢失"""
+    config.set('learning_rate', 0.01, autosave=False)
+    assert config._autosave_manager._autosave_timer is None
+
+    config.set('learning_rate', 0.01)
+    assert config._autosave_manager._autosave_timer is not None
+
+    # 类型不同的相等值视为变化
+    config.set('flag', 1, autosave=False)
+    config.set('flag', True, autosave=False)
+    assert config._data['flag'] is True
+    return
@@ -7,6 +7,7 @@ start_time = datetime.now()
 import pytest
 import tempfile
 import os
+import re
 from io import StringIO
 from contextlib import redirect_stdout
 
@@ -241,8 +242,10 @@ class TestCallChainSwitch:
                     "初始化时调用链:"
                 ]
 
-                for keyword in call_chain_keywords:
-                    assert keyword not in captured_output, f"开关关闭时不应显示: {keyword}"
+                # 所有关键字编译为一个正则，对输出只扫描一遍
+                call_chain_re = re.compile('|'.join(map(re.escape, call_chain_keywords)))
+                hits = set(call_chain_re.findall(captured_output))
+                assert not hits, f"开关关闭时不应显示: {hits}"
 
                 # 但应该有基本的操作信息
                 assert ("配置文件不存在" in captured_output or
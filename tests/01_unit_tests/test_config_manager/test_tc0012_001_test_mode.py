@@ -6,9 +6,12 @@ import tempfile
 import os
 import pytest
 import time
+from pathlib import PurePath
 from src.config_manager import get_config_manager, TestEnvironmentManager
 from src.config_manager.config_manager import _clear_instances_for_testing
 
+# 系统临时目录，模块加载时取一次
+_TMPDIR = tempfile.gettempdir()
 
 
 class TestTestMode:
@@ -169,9 +172,8 @@ class TestTestMode:
 
     def test_tc0012_001_006_test_mode_with_explicit_config(self):
         """TC0012-001-006: 测试test_mode与显式配置路径"""
-        # 创建一个临时的生产配置文件
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write("""
+        # 创建一个临时的生产配置文件，保留写入的内容用于之后比对
+        prod_config_content = """
 __data__:
   app_name: "生产应用"
   version: "2.0.0"
@@ -179,7 +181,9 @@ __data__:
     host: "prod-db"
     port: 3306
 __type_hints__: {}
-""")
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
+            f.write(prod_config_content)
             prod_config_path = f.name
         
         try:
@@ -189,7 +193,7 @@ __type_hints__: {}
             # 验证配置被复制到测试环境
             test_path = cfg.get_config_file_path()
             assert test_path != prod_config_path
-            assert tempfile.gettempdir() in test_path
+            assert _TMPDIR in test_path
             
             # 验证配置内容被复制
             assert cfg.get('app_name') == "生产应用"
@@ -200,19 +204,16 @@ __type_hints__: {}
             cfg.app_name = "测试应用"
             cfg.save()
             
-            # 清理缓存以确保获取新的配置实例
-            _clear_instances_for_testing()
-            
-            # 验证生产配置文件未被修改
-            prod_cfg = get_config_manager(config_path=prod_config_path, test_mode=True)
-            assert prod_cfg.get('app_name') == "生产应用"
+            # 验证生产配置文件未被修改：直接与写入的内容比对，无需再创建测试环境
+            with open(prod_config_path, 'r', encoding='utf-8') as f:
+                assert f.read() == prod_config_content
             
             print(f"✓ 生产配置路径: {prod_config_path}")
             print(f"✓ 测试配置路径: {test_path}")
             
         finally:
             # 清理临时文件
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path)
 
     def test_tc0012_001_007_test_mode_performance(self):
@@ -397,14 +398,13 @@ __type_hints__: {}
             datetime.now()
             
             # 从路径中提取时间信息
-            path_parts = cfg._config_path.split(os.sep)
+            path_parts = PurePath(cfg._config_path).parts
             # 路径格式: .../tests/YYYYMMDD/HHMMSS/project_name/src/config/config.yaml
             # 找到 tests 目录的位置
-            tests_index = -1
-            for i, part in enumerate(path_parts):
-                if part == 'tests':
-                    tests_index = i
-                    break
+            try:
+                tests_index = path_parts.index('tests')
+            except ValueError:
+                tests_index = -1
             
             if tests_index >= 0 and tests_index + 2 < len(path_parts):
                 date_str = path_parts[tests_index + 1]  # YYYYMMDD
@@ -422,9 +422,11 @@ __type_hints__: {}
             
         finally:
             # 清理临时文件
-            if os.path.exists(prod_config_path):
-                assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
+            try:
                 os.unlink(prod_config_path)
+            except FileNotFoundError:
+                pass
 
     def test_tc0012_001_014_test_mode_config_copy_with_time(self):
         """TC0012-001-014: 测试配置复制时正确处理first_start_time"""
@@ -475,7 +477,7 @@ __type_hints__: {}
             
         finally:
             # 清理临时文件
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path)
 
     def test_tc0012_001_015_test_mode_time_format_validation(self):
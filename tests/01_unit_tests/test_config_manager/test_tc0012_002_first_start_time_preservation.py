@@ -3,9 +3,29 @@ from __future__ import annotations
 
 import os
 import tempfile
+import pytest
 from datetime import datetime
 from src.config_manager import get_config_manager, _clear_instances_for_testing
 
+# 系统临时目录，模块加载时取一次
+_TMPDIR = tempfile.gettempdir()
+
+# 生产配置中记录的首次启动时间
+_ORIGINAL_TIME = datetime(2025, 1, 1, 10, 0, 0)
+
+
+@pytest.fixture(scope='module')
+def prod_config_with_start_time(tmp_path_factory):
+    """包含first_start_time的生产配置，测试模式只读取不修改，模块内共享一份"""
+    config_file = tmp_path_factory.mktemp('prod_config') / 'config.yaml'
+    config_file.write_text(f"""
+__data__:
+  app_name: "生产应用"
+  first_start_time: "{_ORIGINAL_TIME.isoformat()}"
+  some_config: "value"
+__type_hints__: {{}}
+""", encoding='utf-8')
+    return str(config_file)
 
 
 class TestFirstStartTimePreservation:
@@ -28,78 +48,43 @@ class TestFirstStartTimePreservation:
         # 清理所有实例
         _clear_instances_for_testing()
 
-    def test_tc0012_002_001_preserve_original_first_start_time(self):
+    def test_tc0012_002_001_preserve_original_first_start_time(self, prod_config_with_start_time):
         """TC0012-002-001: 测试保留原配置中的first_start_time"""
-        # 创建一个包含first_start_time的临时生产配置
-        original_time = datetime(2025, 1, 1, 10, 0, 0)
+        # 使用测试模式，不传入first_start_time参数
+        cfg = get_config_manager(config_path=prod_config_with_start_time, test_mode=True)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write(f"""
-__data__:
-  app_name: "生产应用"
-  first_start_time: "{original_time.isoformat()}"
-  some_config: "value"
-__type_hints__: {{}}
-""")
-            prod_config_path = f.name
+        # 验证first_start_time被保留
+        stored_time_str = cfg.get('first_start_time')
+        assert stored_time_str == _ORIGINAL_TIME.isoformat(), \
+            f"应该保留原配置的时间 {_ORIGINAL_TIME.isoformat()}，实际: {stored_time_str}"
         
-        try:
-            # 使用测试模式，不传入first_start_time参数
-            cfg = get_config_manager(config_path=prod_config_path, test_mode=True)
-            
-            # 验证first_start_time被保留
-            stored_time_str = cfg.get('first_start_time')
-            assert stored_time_str == original_time.isoformat(), \
-                f"应该保留原配置的时间 {original_time.isoformat()}，实际: {stored_time_str}"
-            
-            # 验证其他配置也被正确复制
-            assert cfg.get('app_name') == "生产应用"
-            assert cfg.get('some_config') == "value"
-            
-            print(f"✓ 成功保留原配置中的first_start_time: {stored_time_str}")
-            
-        finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
-            os.unlink(prod_config_path)
+        # 验证其他配置也被正确复制
+        assert cfg.get('app_name') == "生产应用"
+        assert cfg.get('some_config') == "value"
+        
+        print(f"✓ 成功保留原配置中的first_start_time: {stored_time_str}")
 
-    def test_tc0012_002_002_override_with_parameter(self):
+    def test_tc0012_002_002_override_with_parameter(self, prod_config_with_start_time):
         """TC0012-002-002: 测试传入参数覆盖原配置中的first_start_time"""
-        # 创建一个包含first_start_time的临时生产配置
-        original_time = datetime(2025, 1, 1, 10, 0, 0)
         override_time = datetime(2025, 6, 7, 15, 30, 0)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write(f"""
-__data__:
-  app_name: "生产应用"
-  first_start_time: "{original_time.isoformat()}"
-  some_config: "value"
-__type_hints__: {{}}
-""")
-            prod_config_path = f.name
+        # 使用测试模式，传入first_start_time参数
+        cfg = get_config_manager(
+            config_path=prod_config_with_start_time, 
+            test_mode=True, 
+            first_start_time=override_time
+        )
         
-        try:
-            # 使用测试模式，传入first_start_time参数
-            cfg = get_config_manager(
-                config_path=prod_config_path, 
-                test_mode=True, 
-                first_start_time=override_time
-            )
-            
-            # 验证first_start_time被覆盖为传入的参数
-            stored_time_str = cfg.get('first_start_time')
-            assert stored_time_str == override_time.isoformat(), \
-                f"应该使用传入的时间 {override_time.isoformat()}，实际: {stored_time_str}"
-            
-            # 验证其他配置也被正确复制
-            assert cfg.get('app_name') == "生产应用"
-            assert cfg.get('some_config') == "value"
-            
-            print(f"✓ 成功使用传入参数覆盖first_start_time: {stored_time_str}")
-            
-        finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
-            os.unlink(prod_config_path)
+        # 验证first_start_time被覆盖为传入的参数
+        stored_time_str = cfg.get('first_start_time')
+        assert stored_time_str == override_time.isoformat(), \
+            f"应该使用传入的时间 {override_time.isoformat()}，实际: {stored_time_str}"
+        
+        # 验证其他配置也被正确复制
+        assert cfg.get('app_name') == "生产应用"
+        assert cfg.get('some_config') == "value"
+        
+        print(f"✓ 成功使用传入参数覆盖first_start_time: {stored_time_str}")
 
     def test_tc0012_002_003_set_current_time_when_missing(self):
         """TC0012-002-003: 测试在没有first_start_time时设置当前时间"""
@@ -141,7 +126,7 @@ __type_hints__: {}
             print(f"✓ 成功设置当前时间作为first_start_time: {stored_time_str}")
             
         finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path)
 
     def test_tc0012_002_004_raw_yaml_format_preservation(self):
@@ -176,7 +161,7 @@ database:
             print(f"✓ 原始格式配置中的first_start_time保留成功: {stored_time_str}")
             
         finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path)
 
     def test_tc0012_002_005_priority_order_verification(self):
@@ -216,7 +201,7 @@ __type_hints__: {{}}
             print("✓ 优先级顺序验证通过：传入参数 > 原配置")
             
         finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path)
 
     def test_tc0012_002_006_custom_logger_integration(self):
@@ -261,5 +246,5 @@ __type_hints__: {{}}
             print(f"  - 计算的运行时长: {runtime_seconds:.2f}秒")
             
         finally:
-            assert prod_config_path.startswith(tempfile.gettempdir()), f"禁止删除非临时文件: {prod_config_path}"
+            assert prod_config_path.startswith(_TMPDIR), f"禁止删除非临时文件: {prod_config_path}"
             os.unlink(prod_config_path) 
\ No newline at end of file
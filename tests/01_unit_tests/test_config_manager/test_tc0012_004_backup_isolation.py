@@ -2,6 +2,7 @@
 from __future__ import annotations
 from datetime import datetime
 import os
+from pathlib import PurePath
 from unittest.mock import patch, MagicMock
 from src.config_manager import get_config_manager, _clear_instances_for_testing
 
@@ -120,7 +121,7 @@ class TestTC0012004BackupIsolation:
         
         # 验证目录结构
         # 新的期望结构：{temp}/tests/20250107/100000/test_project/experiment_name/backup/20250107/100000/config_20250107_100000.yaml
-        path_parts = backup_path.replace('\\', '/').split('/')
+        path_parts = PurePath(backup_path).parts
         
         # 查找关键目录
         assert 'tests' in path_parts
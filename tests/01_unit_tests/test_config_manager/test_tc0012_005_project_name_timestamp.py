@@ -95,8 +95,10 @@ __type_hints__: {}
             print(f"✓ 传入参数优先级验证通过: {first_start_time1}")
             
         finally:
-            if os.path.exists(temp_config_path1):
+            try:
                 os.unlink(temp_config_path1)
+            except FileNotFoundError:
+                pass
         
         # 清理实例以准备下一个测试
         _clear_instances_for_testing()
@@ -124,8 +126,10 @@ __type_hints__: {{}}
             print(f"✓ 配置文件优先级验证通过: {first_start_time2}")
             
         finally:
-            if os.path.exists(temp_config_path2):
+            try:
                 os.unlink(temp_config_path2)
+            except FileNotFoundError:
+                pass
 
     def test_tc0012_005_005_default_project_name(self):
         """测试默认project_name的使用"""
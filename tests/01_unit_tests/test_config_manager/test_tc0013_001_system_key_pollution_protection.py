@@ -25,6 +25,9 @@ import yaml
 from config_manager import get_config_manager
 from config_manager.config_node import ConfigNode
 
+# 优先使用libyaml的C加载器，未安装时回退到纯Python实现
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class TestSystemKeyPollutionProtection:
     """系统键污染防护测试类"""
@@ -163,7 +166,7 @@ class TestSystemKeyPollutionProtection:
             # 验证文件结构正确
             actual_config_path = config.get_config_path()
             with open(actual_config_path, 'r', encoding='utf-8') as f:
-                file_content = yaml.safe_load(f)
+                file_content = yaml.load(f, Loader=YamlLoader)
             
             # 检查文件顶层结构
             assert '__data__' in file_content, "配置文件应该有__data__节点"
@@ -204,7 +207,7 @@ class TestSystemKeyPollutionProtection:
             # 验证保存的文件结构
             actual_config_path = config.get_config_path()
             with open(actual_config_path, 'r', encoding='utf-8') as f:
-                file_content = yaml.safe_load(f)
+                file_content = yaml.load(f, Loader=YamlLoader)
             
             # 验证顶层结构
             required_top_level_keys = {'__data__', '__type_hints__'}
@@ -271,7 +274,7 @@ class TestSystemKeyPollutionProtection:
             # 重新读取文件，验证污染已被清理（使用实际的配置文件路径）
             actual_config_path = config.get_config_path()
             with open(actual_config_path, 'r', encoding='utf-8') as f:
-                cleaned_content = yaml.safe_load(f)
+                cleaned_content = yaml.load(f, Loader=YamlLoader)
             
             # 验证__data__节点已被清理
             data_section = cleaned_content['__data__']
@@ -315,7 +318,7 @@ class TestSystemKeyPollutionProtection:
                 
                 # 重新读取验证
                 with open(config.get_config_path(), 'r', encoding='utf-8') as f:
-                    content = yaml.safe_load(f)
+                    content = yaml.load(f, Loader=YamlLoader)
                 
                 # 每次都验证没有污染
                 data_section = content['__data__']
@@ -396,7 +399,7 @@ class TestSystemKeyPollutionProtection:
             
             # 验证文件结构
             with open(config.get_config_path(), 'r', encoding='utf-8') as f:
-                file_content = yaml.safe_load(f)
+                file_content = yaml.load(f, Loader=YamlLoader)
             
             data_section = file_content['__data__']
             for sys_key in system_keys:
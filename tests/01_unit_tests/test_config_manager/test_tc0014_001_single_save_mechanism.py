@@ -101,7 +101,7 @@ base_dir: "/tmp/autosave_test"
             actual_config_path = config.get_config_file_path()
             
             with open(actual_config_path, 'r') as f:
-                saved_config = yaml.safe_load(f)
+                saved_config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
             
             # 验证值被正确保存到__data__节点中
             if '__data__' in saved_config:
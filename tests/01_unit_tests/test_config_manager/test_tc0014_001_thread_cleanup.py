@@ -153,8 +153,10 @@ print("Exiting...")
                 
         finally:
             # 清理临时脚本
-            if os.path.exists(script_path):
+            try:
                 os.unlink(script_path)
+            except FileNotFoundError:
+                pass
 
     def test_demonstrate_current_problem(self):
         """演示当前存在的问题"""
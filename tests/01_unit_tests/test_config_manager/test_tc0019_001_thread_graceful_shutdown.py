@@ -4,6 +4,7 @@ from datetime import datetime
 
 import threading
 import time
+import shutil
 import tempfile
 import os
 import pytest
@@ -103,10 +104,11 @@ def test_multiple_config_managers_cleanup():
         
     finally:
         # 清理临时目录
-        import shutil
         for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
+            try:
                 shutil.rmtree(temp_dir)
+            except FileNotFoundError:
+                pass
 
 
 def test_cleanup_prevents_duplicate_calls():
@@ -89,8 +89,10 @@ if __name__ == "__main__":
         
     finally:
         # 清理测试脚本
-        if os.path.exists(script_path):
+        try:
             os.unlink(script_path)
+        except FileNotFoundError:
+            pass
 
 
 @pytest.mark.skipif(platform.system() == 'Windows', reason="Windows进程管理差异")
@@ -140,8 +142,10 @@ def main():
         # 清理临时目录
         import shutil
         for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
+            try:
                 shutil.rmtree(temp_dir)
+            except FileNotFoundError:
+                pass
 
 if __name__ == "__main__":
     main()
@@ -181,8 +185,10 @@ if __name__ == "__main__":
         pytest.fail("多实例程序执行超时，可能存在线程挂起问题")
         
     finally:
-        if os.path.exists(script_path):
+        try:
             os.unlink(script_path)
+        except FileNotFoundError:
+            pass
 
 
 @pytest.mark.skipif(platform.system() == 'Windows', reason="Windows不支持Unix信号处理")
@@ -282,8 +288,10 @@ if __name__ == "__main__":
         assert "收到信号" in stdout, "程序应该收到并处理信号"
         
     finally:
-        if os.path.exists(script_path):
+        try:
             os.unlink(script_path)
+        except FileNotFoundError:
+            pass
 
 
 if __name__ == "__main__":
@@ -7,7 +7,9 @@ import tempfile
 import shutil
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+tests_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if tests_dir not in sys.path:
+    sys.path.insert(0, tests_dir)
 from utils.path_test_helper import PathTestHelper
 from config_manager import get_config_manager
 from config_manager.core.path_resolver import PathResolver
@@ -22,8 +24,10 @@ class TestTsbLogsPathGeneration:
         
     def teardown_method(self):
         """测试后清理"""
-        if os.path.exists(self.test_dir):
+        try:
             shutil.rmtree(self.test_dir)
+        except FileNotFoundError:
+            pass
     
     def test_tsb_logs_path_format(self):
         """测试TSB日志路径格式是否正确"""
@@ -6,7 +6,9 @@ import sys
 import pytest
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+tests_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if tests_dir not in sys.path:
+    sys.path.insert(0, tests_dir)
 from utils.path_test_helper import PathTestHelper
 from config_manager import get_config_manager
 from config_manager.core.path_resolver import PathResolver
@@ -5,7 +5,9 @@ import os
 import sys
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+tests_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if tests_dir not in sys.path:
+    sys.path.insert(0, tests_dir)
 from utils.path_test_helper import PathTestHelper
 from config_manager.core.path_resolver import PathResolver
 from config_manager.core.path_configuration import TimeProcessor
@@ -0,0 +1,26 @@
+# tests/01_unit_tests/test_config_manager/test_type_hints_loading.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import pytest
+
+from config_manager.config_manager import get_config_manager, _clear_instances_for_testing
+
+
+@pytest.mark.parametrize('type_hints_yaml', ['{}', 'null'])
+def test_empty_type_hints_section_gives_own_dict(tmp_path, type_hints_yaml):
+    """空的或为null的__type_hints__加载为实例自己的空字典，之后仍可添加类型注释"""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(f"__data__:\n  name: demo\n__type_hints__: {type_hints_yaml}\n", encoding='utf-8')
+    _clear_instances_for_testing()
+    try:
+        cfg = get_config_manager(config_path=str(config_file), watch=False)
+        assert isinstance(cfg._type_hints, dict)
+
+        cfg.set('count', 3, autosave=False, type_hint=int)
+        assert cfg.get_type_hint('count') == 'int'
+    finally:
+        _clear_instances_for_testing()
+    return
@@ -0,0 +1,121 @@
+# tests/01_unit_tests/test_config_manager/test_update_batches_path_config.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+from unittest.mock import patch
+
+import pytest
+
+from config_manager.config_manager import ConfigManager, get_config_manager, _clear_instances_for_testing
+
+
+def test_update_regenerates_paths_once(tmp_path):
+    """批量更新多个路径相关键时只重新生成一次路径配置，且结果反映全部新值"""
+    _clear_instances_for_testing()
+    try:
+        config = get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+
+        with patch.object(ConfigManager, '_update_path_configuration',
+                          autospec=True, side_effect=ConfigManager._update_path_configuration) as update_paths:
+            config.update({
+                'base_dir': str(tmp_path),
+                'project_name': 'batch_project',
+                'experiment_name': 'batch_exp',
+                'learning_rate': 0.01,
+            })
+
+        assert update_paths.call_count == 1
+        assert config._pending_path_update is None
+        assert config.learning_rate == 0.01
+        work_dir = config.paths.work_dir
+        assert 'batch_project' in work_dir and 'batch_exp' in work_dir
+
+        # 批量更新之外的单个set仍然立即更新路径配置
+        with patch.object(ConfigManager, '_update_path_configuration', autospec=True) as update_paths:
+            config.set('project_name', 'single_project')
+        assert update_paths.call_count == 1
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_update_regenerates_paths_when_later_key_fails(tmp_path):
+    """批量更新中途失败时，已写入的路径相关键仍会重新生成路径配置"""
+    _clear_instances_for_testing()
+    try:
+        config = get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+        original_set = ConfigManager.set
+
+        def failing_set(self, key, value, *args, **kwargs):
+            if key == 'broken':
+                raise ValueError("写入失败")
+            return original_set(self, key, value, *args, **kwargs)
+
+        with patch.object(ConfigManager, 'set', autospec=True, side_effect=failing_set):
+            with pytest.raises(ValueError):
+                config.update({'project_name': 'partial_project', 'broken': 1})
+
+        assert config._pending_path_update is None
+        assert 'partial_project' in config.paths.work_dir
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_update_without_path_keys_skips_regeneration():
+    """不含路径相关键的批量更新不重新生成路径配置"""
+    _clear_instances_for_testing()
+    try:
+        config = get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+
+        with patch.object(ConfigManager, '_update_path_configuration', autospec=True) as update_paths:
+            config.update(batch_size=32, epochs=10)
+
+        assert update_paths.call_count == 0
+        assert config.batch_size == 32
+        assert config.epochs == 10
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_update_with_save_writes_once(tmp_path):
+    """save=True时路径配置重新生成后保存一次，且不安排自动保存"""
+    _clear_instances_for_testing()
+    try:
+        config = get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+
+        with patch.object(ConfigManager, 'save', autospec=True, side_effect=ConfigManager.save) as save:
+            config.update({'project_name': 'saved_project', 'batch_size': 64}, save=True)
+
+        assert save.call_count == 1
+        assert config._autosave_manager._autosave_timer is None
+        assert 'saved_project' in config.paths.work_dir
+        with open(config.get_config_path(), 'r', encoding='utf-8') as f:
+            raw = f.read()
+        assert 'saved_project' in raw and 'batch_size: 64' in raw
+    finally:
+        _clear_instances_for_testing()
+    return
+
+
+def test_update_keyword_form_honours_save():
+    """关键字形式调用时save参数同样生效，且不会被写成名为save的配置键"""
+    _clear_instances_for_testing()
+    try:
+        config = get_config_manager(test_mode=True, watch=False, first_start_time=datetime(2025, 1, 8, 10, 30, 0))
+
+        with patch.object(ConfigManager, 'save', autospec=True, side_effect=ConfigManager.save) as save:
+            config.update(project_name='keyword_project', batch_size=16, save=True)
+
+        assert save.call_count == 1
+        assert 'save' not in config._data
+        assert config._autosave_manager._autosave_timer is None
+        with open(config.get_config_path(), 'r', encoding='utf-8') as f:
+            raw = f.read()
+        assert 'keyword_project' in raw and 'batch_size: 16' in raw
+    finally:
+        _clear_instances_for_testing()
+    return
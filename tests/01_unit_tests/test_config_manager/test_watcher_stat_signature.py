@@ -0,0 +1,68 @@
+# tests/01_unit_tests/test_config_manager/test_watcher_stat_signature.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+
+from config_manager.core.watcher import FileWatcher
+
+
+def _make_watcher(config_path: str, calls: list) -> FileWatcher:
+    """构造不启动监视线程的FileWatcher，由测试直接调用单次检查"""
+    watcher = FileWatcher()
+    watcher._config_path = config_path
+    watcher._callback = lambda: calls.append(watcher._stat_signature(config_path))
+    watcher._last_signature = watcher._stat_signature(config_path)
+    return watcher
+
+
+def test_stat_signature_reports_mtime_and_size(tmp_path):
+    """签名由纳秒修改时间和文件大小组成，文件不存在时为None"""
+    config_file = tmp_path / 'config.yaml'
+    assert FileWatcher._stat_signature(str(config_file)) is None
+
+    config_file.write_text("name: a\n", encoding='utf-8')
+    st = os.stat(config_file)
+    assert FileWatcher._stat_signature(str(config_file)) == (st.st_mtime_ns, st.st_size)
+    return
+
+
+def test_size_change_with_same_mtime_triggers_callback(tmp_path):
+    """修改时间不变但大小变化时也能检测到文件变化"""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text("name: a\n", encoding='utf-8')
+    original_stat = os.stat(config_file)
+    calls = []
+    watcher = _make_watcher(str(config_file), calls)
+
+    config_file.write_text("name: longer\n", encoding='utf-8')
+    os.utime(config_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    expected = (original_stat.st_mtime_ns, os.stat(config_file).st_size)
+
+    watcher._check_for_change()
+    assert calls == [expected], "大小变化应触发一次回调"
+    assert watcher._last_signature == expected
+
+    # 文件未再变化时不重复触发
+    watcher._check_for_change()
+    assert len(calls) == 1
+    return
+
+
+def test_internal_save_is_recorded_without_callback(tmp_path):
+    """内部保存引起的变化只记录新状态，不触发回调"""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text("name: a\n", encoding='utf-8')
+    calls = []
+    watcher = _make_watcher(str(config_file), calls)
+
+    watcher.set_internal_save_flag(True)
+    config_file.write_text("name: internal\n", encoding='utf-8')
+    watcher._check_for_change()
+
+    assert calls == []
+    assert watcher._last_signature == FileWatcher._stat_signature(str(config_file))
+    assert watcher._internal_save_flag is False
+    return
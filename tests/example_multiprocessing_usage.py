@@ -23,7 +23,9 @@ from datetime import datetime
 
 # 如果在其他项目中使用，请根据实际情况调整导入路径
 # 当前路径适用于config_manager项目内部测试
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 try:
     from config_manager import get_config_manager, SerializableConfigData
@@ -261,4 +261,31 @@ class TestSingletonPathResolution:
                 assert temp_dir.startswith(tempfile.gettempdir()), f"禁止删除非临时目录: {temp_dir}"
                 shutil.rmtree(temp_dir)
             except Exception:
-                pass 
\ No newline at end of file
+                pass 
+
+    def test_tc0006_006_production_cache_hit_skips_instance_creation(self):
+        """测试生产模式重复获取同一路径时直接命中缓存"""
+        from unittest.mock import patch
+        from config_manager import get_config_manager
+        from config_manager.config_manager import ConfigManager
+
+        temp_dir = tempfile.mkdtemp(prefix="test_prod_cache_")
+        config_file = os.path.join(temp_dir, 'config.yaml')
+
+        try:
+            cm1 = get_config_manager(config_path=config_file, watch=False, auto_create=True)
+            assert cm1 is not None
+
+            # 第二次获取不应再进入实例创建流程
+            with patch.object(ConfigManager, '_create_production_instance') as mock_create:
+                cm2 = get_config_manager(config_path=config_file, watch=False, auto_create=True)
+                mock_create.assert_not_called()
+
+            assert cm2 is cm1, "相同配置路径应该返回同一个实例"
+
+        finally:
+            try:
+                assert temp_dir.startswith(tempfile.gettempdir()), f"禁止删除非临时目录: {temp_dir}"
+                shutil.rmtree(temp_dir)
+            except Exception:
+                pass
\ No newline at end of file
@@ -347,4 +347,49 @@ def test_tc0008_001_009_different_modules():
             assert "module_b_function" in output
 
         print(f"多模块调用链输出:\n{output}")
-        return
\ No newline at end of file
+        return
+
+def test_tc0008_001_010_shared_tracker():
+    """测试所有配置管理器实例共用同一个调用链追踪器"""
+    from config_manager.core.call_chain import GLOBAL_TRACKER
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_a = get_config_manager(config_path=os.path.join(temp_dir, 'a.yaml'), watch=False)
+        config_b = get_config_manager(config_path=os.path.join(temp_dir, 'b.yaml'), watch=False)
+
+        assert config_a._get_call_chain_tracker() is GLOBAL_TRACKER
+        assert config_b._get_call_chain_tracker() is GLOBAL_TRACKER
+
+        _clear_instances_for_testing()
+    return
+
+
+def test_tc0008_001_011_tracker_does_not_keep_frames_alive():
+    """测试共享追踪器的缓存不会让调用方帧中的局部变量滞留"""
+    import weakref
+    from config_manager.core.call_chain import GLOBAL_TRACKER
+
+    class Marker:
+        pass
+
+    def caller():
+        marker = Marker()
+        GLOBAL_TRACKER.get_call_chain()
+        return weakref.ref(marker)
+
+    marker_ref = caller()
+    gc.collect()
+    assert marker_ref() is None
+    return
+
+
+def test_tc0008_001_012_chain_reflects_current_locals():
+    """测试同一调用位置重复查询时，调用链反映当前的局部变量"""
+    tracker = CallChainTracker()
+    chains = []
+    for config in (1, 'text'):
+        chains.append(tracker.get_call_chain())
+
+    assert 'config:int' in chains[0]
+    assert 'config:str' in chains[1]
+    return
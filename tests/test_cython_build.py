@@ -0,0 +1,60 @@
+# tests/test_cython_build.py
+from __future__ import annotations
+from datetime import datetime
+
+start_time = datetime.now()
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('Cython')
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# 复制源码树并实际调用C编译器，耗时较长，可用 -m "not slow" 跳过
+pytestmark = pytest.mark.slow
+
+
+@pytest.mark.skipif(shutil.which('cc') is None and shutil.which('gcc') is None, reason="没有可用的C编译器")
+def test_config_node_builds_under_package_name(tmp_path):
+    """存在Cython时config_node按 config_manager.config_node 编译并可被导入"""
+    # 在副本中构建，避免cythonize生成的.c文件落进源码树
+    shutil.copy2(PROJECT_ROOT / 'setup.py', tmp_path / 'setup.py')
+    shutil.copy2(PROJECT_ROOT / 'pyproject.toml', tmp_path / 'pyproject.toml')
+    shutil.copytree(PROJECT_ROOT / 'src', tmp_path / 'src',
+                    ignore=shutil.ignore_patterns('__pycache__', '*.egg-info'))
+    build_lib = tmp_path / 'build_lib'
+    env = {k: v for k, v in os.environ.items() if k != 'CONFIG_MANAGER_NO_CYTHON'}
+
+    result = subprocess.run(
+        [sys.executable, 'setup.py', '-q', 'build_ext',
+         '--build-lib', str(build_lib), '--build-temp', str(tmp_path / 'build_temp')],
+        cwd=tmp_path, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    built = list((build_lib / 'config_manager').glob('config_node.*'))
+    assert built, f"未生成扩展模块: {result.stderr}"
+
+    # 扩展模块需与纯Python包位于同一目录才会遮蔽config_node.py
+    package_dir = tmp_path / 'src' / 'config_manager'
+    shutil.copy2(built[0], package_dir / built[0].name)
+    check = (
+        "import config_manager.config_node as m\n"
+        "from config_manager.config_node import ConfigNode\n"
+        "assert not m.__file__.endswith('.py'), m.__file__\n"
+        "node = ConfigNode({'a': {'b': 1}})\n"
+        "assert node.a.b == 1\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', check],
+        cwd=tmp_path, env={**env, 'PYTHONPATH': os.pathsep.join([str(tmp_path / 'src')] + sys.path)},
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return
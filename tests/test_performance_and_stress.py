@@ -11,7 +11,9 @@ from pathlib import Path
 from typing import Dict, Any, List
 
 # 添加src目录到Python路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 from config_manager import get_config_manager
 